@@ -31,6 +31,41 @@ if 'indexed' not in st.session_state:
     st.session_state.indexed = False
 if 'selected_file' not in st.session_state:
     st.session_state.selected_file = None
+if 'index_token' not in st.session_state:
+    st.session_state.index_token = None
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _read_source(file_path, mtime):
+    """Read a source file once per (path, mtime); reruns hit the cache."""
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.readlines()
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_search(query, search_type, case_sensitive, file_types, index_token, version):
+    """Run a search once per (query, options, index identity and version).
+
+    st.cache_data is process-global and the version counter restarts at
+    zero for every fresh indexer, so the per-index token keeps results
+    from one indexed project from being served for another.
+    """
+    searcher = st.session_state.searcher
+    if search_type == "Regex":
+        return searcher.regex_search(
+            query,
+            case_sensitive=case_sensitive,
+            file_types=list(file_types)
+        )
+    return searcher.search(
+        query,
+        search_type.lower(),
+        case_sensitive=case_sensitive,
+        file_types=list(file_types)
+    )
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _dep_graph(file_path, index_token, version):
+    """Build the dependency graph HTML once per (file, index identity and version)."""
+    return st.session_state.visualizer.generate_dependency_graph(file_path)
 
 def main():
     st.title("C++ Codebase Search Tool")
@@ -53,6 +88,9 @@ def main():
                     
                     # Index the codebase
                     indexer.index_codebase()
+
+                    # Unique token per indexing run; see _cached_search
+                    st.session_state.index_token = f"{indexer.project_path}:{time.time_ns()}"
                     
                     # Create searcher and visualizer
                     st.session_state.searcher = CodebaseSearcher(indexer)
@@ -117,19 +155,14 @@ def main():
     if st.button("Search", disabled=not search_query):
         with st.spinner("Searching..."):
             try:
-                if search_type == "Regex":
-                    search_results = st.session_state.searcher.regex_search(
-                        search_query, 
-                        case_sensitive=case_sensitive,
-                        file_types=file_type_filter
-                    )
-                else:
-                    search_results = st.session_state.searcher.search(
-                        search_query, 
-                        search_type.lower(), 
-                        case_sensitive=case_sensitive,
-                        file_types=file_type_filter
-                    )
+                search_results = _cached_search(
+                    search_query,
+                    search_type,
+                    case_sensitive,
+                    tuple(file_type_filter),
+                    st.session_state.index_token,
+                    st.session_state.indexer.version
+                )
                 
                 # Display results
                 if search_results:
@@ -146,32 +179,32 @@ def main():
                             "Full Path": result["file"]
                         })
                     
-                    results_df = pd.DataFrame(results_data)
-                    
-                    # Sort by relevance
-                    results_df = results_df.sort_values("Relevance", ascending=False)
-                    
+                    # Sort by relevance in place; a DataFrame round-trip is
+                    # unnecessary overhead for result sets this size
+                    results_data.sort(key=lambda r: r["Relevance"], reverse=True)
+                    st.session_state.search_results = results_data
+
                     # Display clickable results
                     st.subheader("Search Results")
-                    
-                    # Use AgGrid for better table interaction
-                    results_table = st.dataframe(
-                        results_df[["File", "Line", "Match", "Relevance"]],
+
+                    st.dataframe(
+                        results_data,
+                        column_order=["File", "Line", "Match", "Relevance"],
                         use_container_width=True,
                         height=300
                     )
-                    
+
                     # File selection
                     selected_indices = st.multiselect(
                         "Select file(s) to view",
-                        options=list(range(len(results_df))),
-                        format_func=lambda x: f"{results_df.iloc[x]['File']} (Line: {results_df.iloc[x]['Line']})"
+                        options=list(range(len(results_data))),
+                        format_func=lambda x: f"{results_data[x]['File']} (Line: {results_data[x]['Line']})"
                     )
-                    
+
                     if selected_indices:
                         selected_index = selected_indices[0]  # Take the first selected file
-                        selected_file = results_df.iloc[selected_index]["Full Path"]
-                        selected_line = results_df.iloc[selected_index]["Line"]
+                        selected_file = results_data[selected_index]["Full Path"]
+                        selected_line = results_data[selected_index]["Line"]
                         
                         st.session_state.selected_file = selected_file
                         
@@ -184,7 +217,11 @@ def main():
                             
                             # Generate and display dependency graph
                             if st.session_state.visualizer:
-                                graph_html = st.session_state.visualizer.generate_dependency_graph(selected_file)
+                                graph_html = _dep_graph(
+                                    selected_file,
+                                    st.session_state.index_token,
+                                    st.session_state.indexer.version
+                                )
                                 st.components.v1.html(graph_html, height=500)
                                 
                                 # Show related components
@@ -237,9 +274,8 @@ def main():
 def display_file_content(file_path, line_number=0, context_lines=3):
     """Display file content with syntax highlighting and context lines."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.readlines()
-        
+        content = _read_source(file_path, os.path.getmtime(file_path))
+
         file_extension = os.path.splitext(file_path)[1].lower()
         language = "cpp"  # Default language
         
@@ -1,15 +1,137 @@
 import os
-import fnmatch
-import time
 from pathlib import Path
 import threading
 from typing import List, Dict, Set, Tuple, Any
-import re
 import hashlib
+import mmap
+import concurrent.futures
+from collections import OrderedDict
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Minimum number of files before parallel parsing is worth the pool startup cost
+PARALLEL_PARSE_THRESHOLD = 32
+
+# Concurrent readers used to keep the I/O queue deep during cold indexing
+READ_THREADS = 32
+
+# File extensions included in the index
+INDEXED_EXTENSIONS = {".cpp", ".h", ".hpp", ".cc", ".cxx", ".rtf"}
+
+# Directory name prefixes skipped during the tree walk
+SKIP_DIR_PREFIXES = ("build", "bin", "obj", ".git")
+
+# Upper bound on the in-memory file content cache (approximate, in bytes)
+CONTENT_CACHE_MAX_BYTES = 256 << 20
+
+# Maximum number of parsed results kept keyed by content hash
+PARSE_CACHE_MAX_ENTRIES = 2000
+
+# Files above this size are hashed via mmap and only a prefix is parsed
+LARGE_FILE_BYTES = 4 << 20
+LARGE_FILE_PARSE_PREFIX = 256 << 10
+
+# Size of the basename Bloom filter in bits (8 KB bitset, fits in L2)
+BLOOM_BITS = 1 << 16
+
+# Extensions watched for filesystem events (str.endswith accepts the tuple directly)
+_WATCH_EXTS = ('.cpp', '.h', '.hpp', '.cc', '.cxx', '.rtf')
+
+
+# Chunk size for streaming hash updates
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def _hash_bytes(data) -> str:
+    """Hash a bytes-like object for change detection (non-cryptographic when available)."""
+    if xxhash:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _new_hasher():
+    """Create an incremental hasher matching _hash_bytes output."""
+    if xxhash:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=16)
+
+
+def _hash_file(file_path: str) -> str:
+    """
+    Hash a file by streaming chunks through the C hasher.
+
+    Both the chunked reads and the hash updates release the GIL, so reader
+    threads hashing for change detection genuinely overlap.
+    """
+    hasher = _new_hasher()
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_BYTES):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _read_and_hash(file_path: str) -> Tuple[str, str, bool]:
+    """
+    Read a file for parsing and return (content, hash, truncated).
+
+    Regular files are read and hashed in streamed chunks so the hash work
+    stays in C with the GIL released. Large files (typically generated
+    headers) are hashed through mmap so the hash never materializes a full
+    Python bytes object, and only a bounded prefix is decoded for parsing.
+    Truncated content is flagged so callers feed it to the parser only and
+    never cache it as the file's full content.
+    """
+    if os.path.getsize(file_path) > LARGE_FILE_BYTES:
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = _hash_bytes(mm)
+                content = mm[:LARGE_FILE_PARSE_PREFIX].decode('utf-8', 'replace')
+        return content, digest, True
+
+    hasher = _new_hasher()
+    parts = []
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_BYTES):
+            hasher.update(chunk)
+            parts.append(chunk)
+
+    raw = parts[0] if len(parts) == 1 else b''.join(parts)
+    return raw.decode('utf-8', 'replace'), hasher.hexdigest(), False
+
+# Parser instance shared by all tasks within a single worker process
+_worker_parser = None
+
+
+def _init_parse_worker(parser):
+    """Store the parser in the worker process so it is pickled only once."""
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _read_worker(file_path: str) -> Tuple[str, Any, Any, Any, Any]:
+    """Read and hash a single file on a reader thread."""
+    try:
+        content, digest, truncated = _read_and_hash(file_path)
+        return file_path, content, digest, truncated, None
+    except Exception as e:
+        return file_path, None, None, False, str(e)
+
+
+def _parse_worker(item: Tuple[str, str]) -> Tuple[str, Any, Any]:
+    """Parse already-read content in a worker process."""
+    file_path, content = item
+    try:
+        return file_path, _worker_parser.parse_file(file_path, content), None
+    except Exception as e:
+        return file_path, None, str(e)
+
+
 class CodebaseIndexer:
     """Class for indexing and monitoring a C++ codebase."""
     
@@ -24,13 +146,29 @@ class CodebaseIndexer:
         self.project_path = os.path.abspath(project_path)
         self.parser = parser
         self.files = {}  # Map of file path to file metadata
-        self.components = {}  # Map of component name to file paths
-        self.functions = {}  # Map of function name to file paths
-        self.classes = {}  # Map of class name to file paths
+        self.components = {}  # Map of component name to set of file ids
+        self.functions = {}  # Map of function name to set of file ids
+        self.classes = {}  # Map of class name to set of file ids
         self.dependencies = {}  # Map of file path to list of dependencies
-        self.ui_elements = {}  # Map of UI element to file paths
-        self.file_contents = {}  # Cache for file contents
+        self.ui_elements = {}  # Map of UI element to set of file ids
+        self._paths = []  # Interned file paths, indexed by file id
+        self._path_ids = {}  # Map of file path to its interned id
+        self.file_contents = OrderedDict()  # LRU cache for file contents, bounded by bytes
+        self._content_bytes = 0  # Approximate size of the content cache
+        # Guards file_contents/_content_bytes: the cache is hit from the
+        # searcher's scan threads and the watchdog thread concurrently, and
+        # the get/move_to_end and pop/insert/evict sequences are not atomic
+        self._content_lock = threading.Lock()
         self.file_hashes = {}  # Map of file path to hash for change detection
+        self.include_to_file = {}  # Map of file basename to file path for include resolution
+        self._basename_bloom = bytearray(BLOOM_BITS >> 3)  # Bloom filter over project basenames
+        self.file_to_symbols = {}  # Reverse index: file path to its symbols per index
+        self._parse_cache = OrderedDict()  # LRU of content hash to parsed metadata
+        self.version = 0  # Bumped on every index mutation so caches can invalidate
+        self.dirty_files = {}  # Map of file path to the version at which it last changed
+        self.full_index_version = 0  # Version of the last full reindex
+        self._reverse_deps = None  # Lazily built map of file path to its dependents
+        self._reverse_deps_version = None
         
         # Setup watchdog for file monitoring
         self.observer = None
@@ -45,124 +183,308 @@ class CodebaseIndexer:
         self.classes = {}
         self.dependencies = {}
         self.ui_elements = {}
-        self.file_contents = {}
+        with self._content_lock:
+            self.file_contents = OrderedDict()
+            self._content_bytes = 0
         self.file_hashes = {}
-        
+        self.include_to_file = {}
+        self._basename_bloom = bytearray(BLOOM_BITS >> 3)
+        self.file_to_symbols = {}
+        self._paths = []
+        self._path_ids = {}
+
         # Find all relevant files
         self._find_files()
         
-        # Parse each file
-        for file_path in self.files:
-            self._parse_file(file_path)
-            
+        # Parse each file, in parallel for large trees
+        paths = list(self.files.keys())
+
+        if len(paths) < PARALLEL_PARSE_THRESHOLD:
+            for file_path in paths:
+                self._parse_file(file_path)
+        else:
+            # Stage 1: overlap reads with a thread pool so the I/O queue stays
+            # deep; hash hits against the parse cache skip parsing entirely
+            to_parse = []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=READ_THREADS) as reader:
+                for file_path, content, digest, truncated, error in reader.map(_read_worker, paths):
+                    if error:
+                        print(f"Error reading file {file_path}: {error}")
+                        continue
+
+                    # Truncated prefixes are parse input only; search reads
+                    # the full content on demand through get_file_content
+                    if not truncated:
+                        self._cache_content(file_path, content)
+                    self.file_hashes[file_path] = digest
+
+                    parsed_data = self._cached_parse(digest)
+                    if parsed_data is not None:
+                        self._apply_parsed_data(file_path, parsed_data)
+                    else:
+                        to_parse.append((file_path, content, digest))
+
+            # Stage 2: parsing is pure compute over strings, so farm it out to
+            # a process pool and merge the results on the main thread
+            if to_parse:
+                digests = {file_path: digest for file_path, _, digest in to_parse}
+                items = [(file_path, content) for file_path, content, _ in to_parse]
+
+                with concurrent.futures.ProcessPoolExecutor(
+                        initializer=_init_parse_worker, initargs=(self.parser,)) as executor:
+                    for file_path, parsed_data, error in executor.map(_parse_worker, items, chunksize=32):
+                        if error:
+                            print(f"Error parsing file {file_path}: {error}")
+                            continue
+
+                        self._store_parse(digests[file_path], parsed_data)
+                        self._apply_parsed_data(file_path, parsed_data)
+
         # Build dependency graph
         self._build_dependency_graph()
-        
+
+        self.version += 1
+        # A full reindex touches everything, so per-file change tracking
+        # restarts here; consumers older than this version must rebuild
+        self.dirty_files.clear()
+        self.full_index_version = self.version
+
         # Set up file monitoring
         self._setup_monitoring()
         
     def _find_files(self):
         """Find all C++, header, and RTF files in the project directory."""
-        patterns = ["*.cpp", "*.h", "*.hpp", "*.cc", "*.cxx", "*.rtf"]
-        
-        for root, _, filenames in os.walk(self.project_path):
-            for pattern in patterns:
-                for filename in fnmatch.filter(filenames, pattern):
-                    file_path = os.path.join(root, filename)
-                    rel_path = os.path.relpath(file_path, self.project_path)
-                    
+        self._scan_directory(self.project_path)
+
+    def _scan_directory(self, directory: str):
+        """Recursively scan a directory with os.scandir, collecting file metadata."""
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
                     # Skip build directories
-                    if any(part.startswith(("build", "bin", "obj", ".git")) for part in rel_path.split(os.sep)):
+                    if entry.name.startswith(SKIP_DIR_PREFIXES):
                         continue
-                    
-                    # Store file metadata
-                    self.files[file_path] = {
-                        "path": file_path,
-                        "name": filename,
-                        "extension": os.path.splitext(filename)[1],
-                        "modified": os.path.getmtime(file_path),
-                        "size": os.path.getsize(file_path)
-                    }
+                    self._scan_directory(entry.path)
+                    continue
+
+                extension = os.path.splitext(entry.name)[1].lower()
+                if extension not in INDEXED_EXTENSIONS:
+                    continue
+
+                # DirEntry caches the stat result from the directory scan,
+                # avoiding a separate stat() syscall per file
+                stat = entry.stat()
+                self.files[entry.path] = {
+                    "path": entry.path,
+                    "name": entry.name,
+                    "extension": extension,
+                    "modified": stat.st_mtime,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size
+                }
+                self.include_to_file[entry.name] = entry.path
+                self._bloom_add(entry.name)
     
     def _parse_file(self, file_path: str):
         """Parse a single file and extract metadata."""
         try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                
-            # Cache content
-            self.file_contents[file_path] = content
-            
-            # Calculate hash for change detection
-            self.file_hashes[file_path] = hashlib.md5(content.encode('utf-8')).hexdigest()
-            
-            # Use the parser to extract metadata
-            parsed_data = self.parser.parse_file(file_path, content)
-            
+            # Read once, hashing via mmap and truncating the parse input for
+            # oversized files
+            content, new_hash, truncated = _read_and_hash(file_path)
+
+            # Cache content; a truncated prefix is fed to the parser only,
+            # and any stale cached copy is dropped so get_file_content
+            # re-reads the full file on demand
+            if truncated:
+                self._evict_content(file_path)
+            else:
+                self._cache_content(file_path, content)
+
+            # Record hash for change detection
+            self.file_hashes[file_path] = new_hash
+
+            # Reuse the cached result for identical content (no-op saves,
+            # duplicated headers); otherwise parse and remember it
+            parsed_data = self._cached_parse(new_hash)
+            if parsed_data is None:
+                parsed_data = self.parser.parse_file(file_path, content)
+                self._store_parse(new_hash, parsed_data)
+
             # Update indices with parsed data
-            if parsed_data:
-                # Update components index
-                for component in parsed_data.get('components', []):
-                    if component not in self.components:
-                        self.components[component] = []
-                    self.components[component].append(file_path)
-                
-                # Update functions index
-                for function in parsed_data.get('functions', []):
-                    if function not in self.functions:
-                        self.functions[function] = []
-                    self.functions[function].append(file_path)
-                
-                # Update classes index
-                for class_name in parsed_data.get('classes', []):
-                    if class_name not in self.classes:
-                        self.classes[class_name] = []
-                    self.classes[class_name].append(file_path)
-                
-                # Update UI elements index
-                for ui_element in parsed_data.get('ui_elements', []):
-                    if ui_element not in self.ui_elements:
-                        self.ui_elements[ui_element] = []
-                    self.ui_elements[ui_element].append(file_path)
-                
-                # Store dependencies for this file
-                self.dependencies[file_path] = parsed_data.get('includes', [])
-                
+            self._apply_parsed_data(file_path, parsed_data)
+
+            # Refresh stat metadata so the change-detection fast path stays valid
+            self._refresh_file_metadata(file_path)
+
         except Exception as e:
             print(f"Error parsing file {file_path}: {str(e)}")
-    
+
+    def _cached_parse(self, content_hash: str):
+        """Look up parsed metadata for a content hash, refreshing its LRU slot."""
+        parsed_data = self._parse_cache.get(content_hash)
+        if parsed_data is not None:
+            self._parse_cache.move_to_end(content_hash)
+        return parsed_data
+
+    def _store_parse(self, content_hash: str, parsed_data: Dict[str, Any]):
+        """Remember parsed metadata for a content hash, bounded by an LRU."""
+        self._parse_cache[content_hash] = parsed_data
+        if len(self._parse_cache) > PARSE_CACHE_MAX_ENTRIES:
+            self._parse_cache.popitem(last=False)
+
+    def _refresh_file_metadata(self, file_path: str):
+        """Update the stat-based metadata for a file after (re)parsing it."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return
+
+        filename = os.path.basename(file_path)
+        self.files[file_path] = {
+            "path": file_path,
+            "name": filename,
+            "extension": os.path.splitext(filename)[1],
+            "modified": stat.st_mtime,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size
+        }
+        self.include_to_file[filename] = file_path
+        self._bloom_add(filename)
+
+    def _apply_parsed_data(self, file_path: str, parsed_data: Dict[str, Any]):
+        """Merge parsed metadata for a single file into the indices."""
+        if not parsed_data:
+            return
+
+        # Record this file's symbols so removal can target just its entries
+        symbols = {
+            "components": set(parsed_data.get('components', [])),
+            "functions": set(parsed_data.get('functions', [])),
+            "classes": set(parsed_data.get('classes', [])),
+            "ui_elements": set(parsed_data.get('ui_elements', []))
+        }
+        self.file_to_symbols[file_path] = symbols
+
+        # Intern the path once; the indices store the small int id instead of
+        # replicating the path string across every symbol bucket
+        file_id = self._intern_path(file_path)
+
+        # Update components index
+        for component in symbols["components"]:
+            self.components.setdefault(component, set()).add(file_id)
+
+        # Update functions index
+        for function in symbols["functions"]:
+            self.functions.setdefault(function, set()).add(file_id)
+
+        # Update classes index
+        for class_name in symbols["classes"]:
+            self.classes.setdefault(class_name, set()).add(file_id)
+
+        # Update UI elements index
+        for ui_element in symbols["ui_elements"]:
+            self.ui_elements.setdefault(ui_element, set()).add(file_id)
+
+        # Store resolved dependencies for this file
+        self.dependencies[file_path] = self._resolve_includes(parsed_data.get('includes', []))
+
+    def _bloom_add(self, name: str):
+        """Record a basename in the Bloom filter."""
+        h = hash(name)
+        bloom = self._basename_bloom
+        for index in (h & (BLOOM_BITS - 1), (h >> 16) & (BLOOM_BITS - 1)):
+            bloom[index >> 3] |= 1 << (index & 7)
+
+    def _bloom_may_contain(self, name: str) -> bool:
+        """Check the Bloom filter; False means the basename is definitely absent."""
+        h = hash(name)
+        bloom = self._basename_bloom
+        for index in (h & (BLOOM_BITS - 1), (h >> 16) & (BLOOM_BITS - 1)):
+            if not bloom[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def _intern_path(self, file_path: str) -> int:
+        """Return the stable integer id for a file path, interning it if new."""
+        file_id = self._path_ids.get(file_path)
+        if file_id is None:
+            file_id = len(self._paths)
+            self._paths.append(file_path)
+            self._path_ids[file_path] = file_id
+        return file_id
+
+    def path_id(self, file_path: str):
+        """Return the interned id for a file path, or None if never indexed."""
+        return self._path_ids.get(file_path)
+
+    def path_for_id(self, file_id: int) -> str:
+        """Return the file path for an interned id."""
+        return self._paths[file_id]
+
+    def paths_for(self, file_ids) -> List[str]:
+        """Translate a collection of interned ids back to file paths."""
+        paths = self._paths
+        return [paths[file_id] for file_id in file_ids]
+
+    def _resolve_includes(self, raw_includes: List[str]) -> List[str]:
+        """Resolve raw include directives to project file paths."""
+        resolved_includes = []
+
+        for include in raw_includes:
+            # Handle both "file.h" and <file.h> includes
+            include_name = os.path.basename(include.strip('"<>'))
+
+            # System headers (<vector>, <string>, ...) never resolve; let the
+            # Bloom filter reject those misses without probing the dict
+            if not self._bloom_may_contain(include_name):
+                continue
+
+            resolved = self.include_to_file.get(include_name)
+            if resolved:
+                resolved_includes.append(resolved)
+
+        return resolved_includes
+
     def _build_dependency_graph(self):
-        """Build a graph of file dependencies based on includes."""
-        # Map include paths to actual file paths
-        include_to_file = {}
-        
-        # First pass: build include to file mapping
-        for file_path in self.files:
-            filename = os.path.basename(file_path)
-            include_to_file[filename] = file_path
-            
-        # Second pass: resolve includes to actual file paths
+        """Re-resolve all stored dependencies in one bulk pass."""
         for file_path, includes in self.dependencies.items():
-            resolved_includes = []
-            
-            for include in includes:
-                # Handle both "file.h" and <file.h> includes
-                include_name = include.strip('"<>')
-                include_name = os.path.basename(include_name)
-                
-                if include_name in include_to_file:
-                    resolved_includes.append(include_to_file[include_name])
-                else:
-                    # Try to find the file in the project
-                    for potential_file in self.files:
-                        if os.path.basename(potential_file) == include_name:
-                            resolved_includes.append(potential_file)
-                            break
-            
-            # Update dependencies with resolved file paths
-            self.dependencies[file_path] = resolved_includes
+            self.dependencies[file_path] = self._resolve_includes(includes)
     
+    def reverse_dependencies(self) -> Dict[str, Set[str]]:
+        """
+        Map of file path to the set of files that include it.
+
+        Built lazily in one pass over the dependency map and cached until the
+        index mutates, so dependents are an O(1) lookup instead of a scan over
+        every file's dependency list.
+        """
+        if self._reverse_deps is None or self._reverse_deps_version != self.version:
+            reverse_deps = {}
+            for file_path, deps in self.dependencies.items():
+                for dep in deps:
+                    reverse_deps.setdefault(dep, set()).add(file_path)
+            self._reverse_deps = reverse_deps
+            self._reverse_deps_version = self.version
+        return self._reverse_deps
+
+    def changed_since(self, version):
+        """
+        Set of file paths changed after a given index version.
+
+        Returns None when only a full rebuild is sound: the caller has no
+        baseline yet, or a full reindex happened since its version. The set
+        may include files dirtied before the caller's version; reprocessing
+        those is redundant but harmless.
+        """
+        if version is None or version < self.full_index_version:
+            return None
+        return {path for path, v in self.dirty_files.items() if v > version}
+
     def _setup_monitoring(self):
         """Set up file system monitoring to detect changes in the codebase."""
         if self.observer:
@@ -178,16 +500,42 @@ class CodebaseIndexer:
         # Start observer in a separate thread
         self.observer.start()
     
+    def _cache_content(self, file_path: str, content: str):
+        """Insert file content into the LRU cache, evicting oldest entries over budget."""
+        with self._content_lock:
+            old = self.file_contents.pop(file_path, None)
+            if old is not None:
+                self._content_bytes -= len(old)
+
+            self.file_contents[file_path] = content
+            self._content_bytes += len(content)
+
+            # Evict least-recently-used entries until within budget
+            while self._content_bytes > CONTENT_CACHE_MAX_BYTES and len(self.file_contents) > 1:
+                _, evicted = self.file_contents.popitem(last=False)
+                self._content_bytes -= len(evicted)
+
+    def _evict_content(self, file_path: str):
+        """Drop a file's content from the LRU cache."""
+        with self._content_lock:
+            old = self.file_contents.pop(file_path, None)
+            if old is not None:
+                self._content_bytes -= len(old)
+
     def get_file_content(self, file_path: str) -> str:
         """Get the content of a file from cache or read it if not cached."""
-        if file_path in self.file_contents:
-            return self.file_contents[file_path]
-            
+        with self._content_lock:
+            content = self.file_contents.get(file_path)
+            if content is not None:
+                self.file_contents.move_to_end(file_path)
+                return content
+
+        # The read happens outside the lock; _cache_content re-acquires it
         try:
             with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
                 content = f.read()
-                self.file_contents[file_path] = content
-                return content
+            self._cache_content(file_path, content)
+            return content
         except Exception as e:
             print(f"Error reading file {file_path}: {str(e)}")
             return ""
@@ -196,12 +544,20 @@ class CodebaseIndexer:
         """Check if a file has changed since it was last indexed."""
         if file_path not in self.file_hashes:
             return True
-            
+
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                new_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
-                return new_hash != self.file_hashes[file_path]
+            # Fast path: an unchanged (mtime, size) pair means no modification,
+            # so a single stat() call avoids re-reading and re-hashing the file
+            stat = os.stat(file_path)
+            metadata = self.files.get(file_path)
+            if (metadata and stat.st_mtime_ns == metadata.get("mtime_ns")
+                    and stat.st_size == metadata.get("size")):
+                return False
+        except OSError:
+            return True
+
+        try:
+            return _hash_file(file_path) != self.file_hashes[file_path]
         except Exception:
             return True
     
@@ -211,58 +567,58 @@ class CodebaseIndexer:
             # Remove file from all indices
             self._remove_file_from_indices(file_path)
             
-        # Re-parse the file
+        # Re-parse the file; its includes are resolved incrementally, so no
+        # codebase-wide dependency rebuild is needed
         self._parse_file(file_path)
-        
-        # Update dependency graph
-        self._build_dependency_graph()
+
+        self.version += 1
+        self.dirty_files[file_path] = self.version
     
     def _remove_file_from_indices(self, file_path: str):
         """Remove a file from all indices."""
-        # Remove from components index
-        for component, files in list(self.components.items()):
-            if file_path in files:
-                files.remove(file_path)
-                if not files:
-                    del self.components[component]
-        
-        # Remove from functions index
-        for function, files in list(self.functions.items()):
-            if file_path in files:
-                files.remove(file_path)
-                if not files:
-                    del self.functions[function]
-        
-        # Remove from classes index
-        for class_name, files in list(self.classes.items()):
-            if file_path in files:
-                files.remove(file_path)
-                if not files:
-                    del self.classes[class_name]
-        
-        # Remove from UI elements index
-        for ui_element, files in list(self.ui_elements.items()):
-            if file_path in files:
-                files.remove(file_path)
-                if not files:
-                    del self.ui_elements[ui_element]
-        
+        # Use the reverse index to touch only this file's own symbols
+        symbols = self.file_to_symbols.pop(file_path, {})
+        file_id = self._path_ids.get(file_path)
+        indices = {
+            "components": self.components,
+            "functions": self.functions,
+            "classes": self.classes,
+            "ui_elements": self.ui_elements
+        }
+
+        if file_id is not None:
+            for kind, index in indices.items():
+                for name in symbols.get(kind, ()):
+                    files = index.get(name)
+                    if files is None:
+                        continue
+                    files.discard(file_id)
+                    if not files:
+                        del index[name]
+
         # Remove from dependencies index
         if file_path in self.dependencies:
             del self.dependencies[file_path]
         
         # Remove from file contents cache
-        if file_path in self.file_contents:
-            del self.file_contents[file_path]
+        self._evict_content(file_path)
         
         # Remove from file hashes
         if file_path in self.file_hashes:
             del self.file_hashes[file_path]
             
+        # Remove from the include resolution map (unless another file shadows it)
+        filename = os.path.basename(file_path)
+        if self.include_to_file.get(filename) == file_path:
+            del self.include_to_file[filename]
+
         # Remove from files index
         if file_path in self.files:
             del self.files[file_path]
 
+        self.version += 1
+        self.dirty_files[file_path] = self.version
+
 
 class CodebaseEventHandler(FileSystemEventHandler):
     """Watchdog event handler for monitoring codebase changes."""
@@ -270,37 +626,61 @@ class CodebaseEventHandler(FileSystemEventHandler):
     def __init__(self, indexer):
         """Initialize the event handler with an indexer."""
         self.indexer = indexer
-        self.last_update_time = time.time()
         self.update_debounce = 2.0  # seconds
-        
+        self._pending = {}  # Map of file path to its pending debounce timer
+        self._lock = threading.Lock()
+
     def on_modified(self, event):
         """Handle file modification events."""
         if not event.is_directory and self._should_process_file(event.src_path):
             self._debounced_update(event.src_path)
-    
+
     def on_created(self, event):
         """Handle file creation events."""
         if not event.is_directory and self._should_process_file(event.src_path):
             self._debounced_update(event.src_path)
-    
+
     def on_deleted(self, event):
         """Handle file deletion events."""
-        if not event.is_directory and event.src_path in self.indexer.files:
+        if event.is_directory:
+            return
+
+        # Drop any pending update for the deleted file
+        with self._lock:
+            timer = self._pending.pop(event.src_path, None)
+        if timer:
+            timer.cancel()
+
+        if event.src_path in self.indexer.files:
             self.indexer._remove_file_from_indices(event.src_path)
-    
+
     def _should_process_file(self, file_path: str) -> bool:
         """Check if a file should be processed based on its extension."""
-        extensions = ['.cpp', '.h', '.hpp', '.cc', '.cxx', '.rtf']
-        return any(file_path.endswith(ext) for ext in extensions)
-    
+        # Hot path for watchdog events: skip hidden paths early and test all
+        # extensions with one C-level endswith call
+        if file_path.startswith('.') or '/.' in file_path or '\\.' in file_path:
+            return False
+        return file_path.endswith(_WATCH_EXTS)
+
     def _debounced_update(self, file_path: str):
-        """Update the file index after a debounce period."""
-        current_time = time.time()
-        
-        # Only process updates after the debounce period
-        if current_time - self.last_update_time >= self.update_debounce:
-            self.last_update_time = current_time
-            
-            # Check if the file has changed
-            if self.indexer.file_changed(file_path):
-                self.indexer.update_file(file_path)
+        """Schedule a per-file update, coalescing bursts of events."""
+        timer = threading.Timer(self.update_debounce, self._flush, args=(file_path,))
+        timer.daemon = True
+
+        # Restart this file's debounce window; other files keep their own timers
+        with self._lock:
+            previous = self._pending.pop(file_path, None)
+            self._pending[file_path] = timer
+
+        if previous:
+            previous.cancel()
+        timer.start()
+
+    def _flush(self, file_path: str):
+        """Re-index a file once its debounce window has passed quietly."""
+        with self._lock:
+            self._pending.pop(file_path, None)
+
+        # Check if the file has changed
+        if self.indexer.file_changed(file_path):
+            self.indexer.update_file(file_path)
@@ -1,30 +1,299 @@
 import re
 import os
+import concurrent.futures
+from collections import OrderedDict
+from hashlib import blake2b
 from typing import Dict, List, Set, Any, Optional, Tuple
 import subprocess
-import tempfile
 from pathlib import Path
 import platform
 
+# Optional C-backed multi-pattern matcher: a true DFA over the fixed keyword
+# set, scanning in strict O(len(content)) with no backtracking. The regex
+# alternation remains as the fallback.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Regex patterns compiled once at import rather than per parser instance
+_INCLUDE_RE = re.compile(r'#include\s+["<](.*)[">]')
+_CLASS_RE = re.compile(r'class\s+(\w+)(?:\s*:\s*(?:public|protected|private)\s+(\w+))?')
+_FUNCTION_RE = re.compile(r'(\w+)\s+(\w+)\s*\([^)]*\)')
+_UI_ELEMENT_RE = re.compile(r'(Button|CheckBox|ComboBox|Dialog|Label|ListView|Menu|ProgressBar|RadioButton|ScrollBar|Slider|Spinner|TabControl|TextBox|ToolBar|TreeView|Window)')
+_RTF_CONTROL_RE = re.compile(r'\\[a-z]+-?\d*|[{}]')
+# Case-sensitive: always run against content that is already lowercased, so
+# the engine skips per-character case folding
+_ACTION_BUTTON_RE = re.compile(r'\baction\s*button\b')
+
+# Keywords that look like function names to the scanner but are control flow
+_CONTROL_KEYWORDS = {
+    'if', 'else', 'for', 'while', 'switch', 'return', 'do', 'catch', 'sizeof',
+    'new', 'delete', 'throw', 'case', 'default', 'operator'
+}
+
+# Access specifiers and modifiers skipped when reading base-class names
+_INHERITANCE_KEYWORDS = {'public', 'protected', 'private', 'virtual'}
+
+# Qualifiers allowed between a function's ')' and its body or terminator
+_FUNCTION_MODIFIERS = {'const', 'noexcept', 'override', 'final'}
+
+# Parser-level memo of parse results keyed by content digest
+_MEMO_MAX_ENTRIES = 1024
+
+
+def _is_ident_start(c: str) -> bool:
+    return c.isalpha() or c == '_'
+
+
+def _scan(content: str) -> Dict[str, List[str]]:
+    """
+    Single-pass scanner over C++ source.
+
+    Walks the content once, branching on the current character to extract
+    include directives, class/struct names (plus base classes), and function
+    definitions, while skipping comments and string literals. Avoids the
+    repeated full-content regex passes of the old implementation.
+    """
+    # Sets during construction: O(1) dedup instead of list membership scans
+    includes: Set[str] = set()
+    classes: Set[str] = set()
+    functions: Set[str] = set()
+
+    # Hot loop: bind lookups to locals so each iteration skips the global and
+    # attribute indirection
+    find = content.find
+    is_ident_start = _is_ident_start
+    control_keywords = _CONTROL_KEYWORDS
+
+    n = len(content)
+    i = 0
+    prev_ident = None  # Most recent identifier, used as the return-type candidate
+    prev_end = 0  # End offset of prev_ident, to inspect the separator text
+
+    while i < n:
+        c = content[i]
+
+        # Comments
+        if c == '/':
+            nxt = content[i + 1] if i + 1 < n else ''
+            if nxt == '/':
+                end = find('\n', i + 2)
+                i = n if end < 0 else end + 1
+                prev_ident = None
+                continue
+            if nxt == '*':
+                end = find('*/', i + 2)
+                i = n if end < 0 else end + 2
+                continue
+            i += 1
+            continue
+
+        # String and character literals
+        if c == '"' or c == "'":
+            quote = c
+            i += 1
+            while i < n:
+                ch = content[i]
+                if ch == '\\':
+                    i += 2
+                    continue
+                i += 1
+                if ch == quote or ch == '\n':
+                    break
+            prev_ident = None
+            continue
+
+        # Preprocessor directives
+        if c == '#':
+            end = find('\n', i)
+            if end < 0:
+                end = n
+            line = content[i + 1:end].lstrip()
+            if line.startswith('include'):
+                rest = line[len('include'):].lstrip()
+                if rest[:1] in ('"', '<'):
+                    close = rest.find('"' if rest[0] == '"' else '>', 1)
+                    if close > 0:
+                        includes.add(rest[1:close])
+            i = end + 1
+            prev_ident = None
+            continue
+
+        # Identifiers and keywords
+        if is_ident_start(c):
+            start = i
+            i += 1
+            while i < n and (content[i].isalnum() or content[i] == '_'):
+                i += 1
+            ident = content[start:i]
+
+            if ident in ('class', 'struct'):
+                i, class_name, parents = _read_class_decl(content, i, n)
+                if class_name:
+                    classes.add(class_name)
+                    classes.update(parents)
+                prev_ident = None
+                continue
+
+            # Function definition or prototype: identifier '(' args ')'
+            # [const/noexcept/...] followed by '{' or ';', preceded by a
+            # return-type identifier
+            j = i
+            while j < n and content[j] in ' \t':
+                j += 1
+            if (j < n and content[j] == '(' and prev_ident
+                    and ident not in control_keywords
+                    and prev_ident not in control_keywords):
+                close = _skip_parens(content, j, n)
+                k = close
+                ok = True
+                while True:
+                    while k < n and content[k] in ' \t\r\n':
+                        k += 1
+                    if k < n and is_ident_start(content[k]):
+                        m_start = k
+                        k += 1
+                        while k < n and (content[k].isalnum() or content[k] == '_'):
+                            k += 1
+                        if content[m_start:k] in _FUNCTION_MODIFIERS:
+                            continue
+                        ok = False
+                    break
+                if ok and k < n and (content[k] == '{' or content[k] == ';'):
+                    # Qualified names (A::b) record the callable name alone;
+                    # the "return_type name" form is recorded only when that
+                    # exact text occurs in the source, so symbol location
+                    # can find whichever string is emitted
+                    sep = content[prev_end:start]
+                    if '::' in sep:
+                        functions.add(ident)
+                    elif sep.isspace():
+                        functions.add(f"{prev_ident} {ident}")
+                    prev_ident = None
+                    i = close
+                    continue
+
+            prev_ident = ident
+            prev_end = i
+            continue
+
+        i += 1
+
+    # Convert to lists once at the end
+    return {'includes': list(includes), 'classes': list(classes),
+            'functions': list(functions)}
+
+
+def _read_class_decl(content: str, i: int, n: int):
+    """Read a class/struct name and any base-class names after a keyword at i."""
+    while i < n and content[i] in ' \t\r\n':
+        i += 1
+
+    if i >= n or not _is_ident_start(content[i]):
+        return i, None, []
+
+    start = i
+    while i < n and (content[i].isalnum() or content[i] == '_'):
+        i += 1
+    class_name = content[start:i]
+
+    # Forward declarations and variable declarations: no body follows
+    parents = []
+    j = i
+    while j < n and content[j] in ' \t\r\n':
+        j += 1
+    if j < n and content[j] == ':':
+        # Inheritance list: collect base-class identifiers up to the body
+        j += 1
+        while j < n and content[j] != '{' and content[j] != ';':
+            if _is_ident_start(content[j]):
+                base_start = j
+                while j < n and (content[j].isalnum() or content[j] == '_'):
+                    j += 1
+                base = content[base_start:j]
+                if base not in _INHERITANCE_KEYWORDS:
+                    parents.append(base)
+            else:
+                j += 1
+        i = j
+
+    return i, class_name, parents
+
+
+def _skip_parens(content: str, i: int, n: int) -> int:
+    """Return the index just past the parenthesized group starting at i."""
+    depth = 0
+    while i < n:
+        c = content[i]
+        if c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
 class CppParser:
     """Parser for C++ code that extracts components, functions, classes, etc."""
-    
+
     def __init__(self):
         """Initialize the C++ parser."""
-        # Regex patterns for parsing
-        self.include_pattern = re.compile(r'#include\s+["<](.*)[">]')
-        self.class_pattern = re.compile(r'class\s+(\w+)(?:\s*:\s*(?:public|protected|private)\s+(\w+))?')
-        self.function_pattern = re.compile(r'(\w+)\s+(\w+)\s*\([^)]*\)')
-        self.ui_element_pattern = re.compile(r'(Button|CheckBox|ComboBox|Dialog|Label|ListView|Menu|ProgressBar|RadioButton|ScrollBar|Slider|Spinner|TabControl|TextBox|ToolBar|TreeView|Window)')
+        # Regex patterns for parsing (shared module-level compiled patterns)
+        self.include_pattern = _INCLUDE_RE
+        self.class_pattern = _CLASS_RE
+        self.function_pattern = _FUNCTION_RE
+        self.ui_element_pattern = _UI_ELEMENT_RE
         self.component_keywords = [
             'widget', 'component', 'control', 'view', 'panel', 'dialog', 'window', 'form',
             'button', 'checkbox', 'radio', 'slider', 'menu', 'toolbar', 'label', 'textbox',
             'listview', 'treeview', 'combobox', 'container', 'scroll', 'tab', 'grid', 'image'
         ]
+        # UI elements and component keywords share one master scan. The ui
+        # branch stays case-sensitive (CamelCase names, no word boundary, as
+        # before); the comp branch is the case-insensitive keyword alternation.
+        self._master_re = re.compile(
+            r'(?P<ui>' + _UI_ELEMENT_RE.pattern + r')'
+            r'|\b(?P<comp>(?i:' + '|'.join(
+                [r'action\s*button'] + [re.escape(k) for k in self.component_keywords]
+            ) + r'))\b'
+        )
+        self._component_kw_set = set(self.component_keywords)
+        # Aho-Corasick automaton over the keywords when the C extension is
+        # available; matches come from one linear pass over lowered content
+        self._components_ac = None
+        if ahocorasick is not None:
+            ac = ahocorasick.Automaton()
+            for k in self.component_keywords:
+                ac.add_word(k, k)
+            ac.make_automaton()
+            self._components_ac = ac
         
         # Try to detect if libclang is available
         self.has_libclang = self._check_libclang()
-        
+
+        # One clang Index serves every parse; creating it per file paid the
+        # library initialization cost on each call
+        self._clang_index = None
+        if self.has_libclang:
+            import clang.cindex
+            self._clang_index = clang.cindex.Index.create()
+
+        # Memo of parse results keyed by content digest: unchanged and
+        # renamed/moved files skip parsing entirely on re-index. LRU-bounded
+        # like the indexer-side caches.
+        self._cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # libclang handles don't pickle; workers recreate theirs lazily.
+        # The memo stays behind too — shipping it to workers is dead weight.
+        state['_clang_index'] = None
+        state['_cache'] = OrderedDict()
+        return state
+
     def _check_libclang(self) -> bool:
         """Check if libclang is available for more accurate parsing."""
         try:
@@ -33,6 +302,63 @@ class CppParser:
         except ImportError:
             return False
     
+    def _scan_ui_and_components(self, content: str) -> Tuple[List[str], List[str]]:
+        """Collect UI element names and component keywords in one regex pass."""
+        if self._components_ac is not None:
+            return self._scan_ui_and_components_ac(content)
+        ui_elements = set()
+        found = set()
+        n = len(content)
+        for m in self._master_re.finditer(content):
+            if m.lastgroup == 'ui':
+                name = m.group('ui')
+                ui_elements.add(name)
+                # A CamelCase UI name at word boundaries also counts as its
+                # lowercase component keyword, which this match shadows
+                kw = name.lower()
+                if kw in self._component_kw_set:
+                    start, end = m.start(), m.end()
+                    if ((start == 0 or not (content[start - 1].isalnum()
+                                            or content[start - 1] == '_'))
+                            and (end == n or not (content[end].isalnum()
+                                                  or content[end] == '_'))):
+                        found.add(kw)
+            else:
+                found.add(' '.join(m.group('comp').lower().split()))
+        # 'action button' consumes its 'button' token, which the per-keyword
+        # scan used to match separately
+        if 'action button' in found:
+            found.add('button')
+        components = [k for k in self.component_keywords if k in found]
+        if 'action button' in found:
+            components.append('action button')
+        return list(ui_elements), components
+
+    def _scan_ui_and_components_ac(self, content: str) -> Tuple[List[str], List[str]]:
+        """Automaton-backed variant: DFA scan over lowered content."""
+        # Lowercase once; the automaton scan, the 'action' probe, and the
+        # action-button regex all reuse this single copy
+        lower = content.lower()
+        n = len(lower)
+        found = set()
+        for end, kw in self._components_ac.iter(lower):
+            # The automaton matches raw substrings; enforce the same word
+            # boundaries the regex alternation had
+            start = end - len(kw) + 1
+            if start and (lower[start - 1].isalnum() or lower[start - 1] == '_'):
+                continue
+            nxt = end + 1
+            if nxt < n and (lower[nxt].isalnum() or lower[nxt] == '_'):
+                continue
+            found.add(kw)
+        if 'action' in lower and _ACTION_BUTTON_RE.search(lower):
+            found.add('action button')
+        ui_elements = set(_UI_ELEMENT_RE.findall(content))
+        components = [k for k in self.component_keywords if k in found]
+        if 'action button' in found:
+            components.append('action button')
+        return list(ui_elements), components
+
     def parse_file(self, file_path: str, content: str) -> Dict[str, Any]:
         """
         Parse a file and extract metadata.
@@ -49,17 +375,59 @@ class CppParser:
             - components: List of UI components
             - ui_elements: List of UI elements
         """
+        # Memo hit: identical content parses to identical metadata, so
+        # re-indexing only pays for changed files. The extension is part of
+        # the key because parsing branches on it (C++ vs RTF handling).
+        digest = blake2b(content.encode('utf-8', 'replace'),
+                         digest_size=16).digest()
+        key = (os.path.splitext(file_path)[1].lower(), digest)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
         # Parse using libclang if available
         if self.has_libclang and file_path.endswith(('.cpp', '.h', '.hpp', '.cc', '.cxx')):
             try:
-                return self._parse_with_libclang(file_path, content)
+                result = self._parse_with_libclang(file_path, content)
             except Exception as e:
                 print(f"Libclang parsing failed for {file_path}: {str(e)}")
                 # Fall back to regex parsing
-        
-        # Use regex parsing as fallback or for RTF files
-        return self._parse_with_regex(file_path, content)
+                result = self._parse_with_regex(file_path, content)
+        else:
+            # Use regex parsing as fallback or for RTF files
+            result = self._parse_with_regex(file_path, content)
+
+        self._cache[key] = result
+        if len(self._cache) > _MEMO_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return result
     
+    def _parse_one(self, item: Tuple[str, str]) -> Dict[str, Any]:
+        """Unpack a (file_path, content) pair for executor.map."""
+        return self.parse_file(item[0], item[1])
+
+    def parse_files(self, items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of (file_path, content) pairs in parallel.
+
+        Parsing is pure per file (only parser config plus the input string),
+        so batches are farmed to a process pool to bypass the GIL. Results
+        come back in input order. Small batches are parsed inline since the
+        pool spin-up would dominate.
+
+        Args:
+            items: List of (file_path, content) tuples
+
+        Returns:
+            List of parse_file result dictionaries, one per input item
+        """
+        if len(items) < 8:
+            return [self.parse_file(path, content) for path, content in items]
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count()) as executor:
+            return list(executor.map(self._parse_one, items, chunksize=16))
+
     def _parse_with_regex(self, file_path: str, content: str) -> Dict[str, Any]:
         """Parse C++ code using regular expressions."""
         result = {
@@ -69,41 +437,30 @@ class CppParser:
             'components': [],
             'ui_elements': []
         }
-        
-        # Extract includes
-        includes = self.include_pattern.findall(content)
-        result['includes'] = includes
-        
+
+        if not content:
+            return result
+
         # Only parse C++ files for code structures
         if file_path.endswith(('.cpp', '.h', '.hpp', '.cc', '.cxx')):
-            # Extract classes
-            classes = self.class_pattern.findall(content)
-            result['classes'] = [class_name for class_name, _ in classes]
-            
-            # Extract inheritance relationships
-            for class_name, parent in classes:
-                if parent and parent not in result['classes']:
-                    result['classes'].append(parent)
-            
-            # Extract functions
-            functions = self.function_pattern.findall(content)
-            result['functions'] = [f"{return_type} {func_name}" for return_type, func_name in functions]
-            
-            # Extract UI elements
-            ui_elements = self.ui_element_pattern.findall(content)
-            result['ui_elements'] = list(set(ui_elements))
-            
-            # Look for component patterns
-            for keyword in self.component_keywords:
-                if re.search(fr'\b{keyword}\b', content, re.IGNORECASE):
-                    if keyword not in result['components']:
-                        result['components'].append(keyword)
-            
-            # Special case for action buttons (common in UI code)
-            if re.search(r'\baction\s*button\b', content, re.IGNORECASE):
-                if 'action button' not in result['components']:
-                    result['components'].append('action button')
-        
+            # Extract includes, classes, and functions in one linear pass
+            scanned = _scan(content)
+            result['includes'] = scanned['includes']
+            result['classes'] = scanned['classes']
+            result['functions'] = scanned['functions']
+
+            # Extract UI elements and component keywords in one shared pass
+            result['ui_elements'], result['components'] = \
+                self._scan_ui_and_components(content)
+        else:
+            # RTF and other non-C++ files: only extract include directives
+            if file_path.endswith('.rtf'):
+                content = _RTF_CONTROL_RE.sub(' ', content)
+            # C-level substring probe short-circuits the regex scan; most
+            # non-C++ files carry no include directives at all
+            if '#include' in content:
+                result['includes'] = list(set(self.include_pattern.findall(content)))
+
         return result
     
     def _parse_with_libclang(self, file_path: str, content: str) -> Dict[str, Any]:
@@ -120,58 +477,58 @@ class CppParser:
                 'ui_elements': []
             }
             
-            # Write content to a temporary file to avoid encoding issues
-            with tempfile.NamedTemporaryFile(suffix='.cpp', delete=False) as temp_file:
-                temp_path = temp_file.name
-                temp_file.write(content.encode('utf-8'))
-            
-            try:
-                # Initialize libclang
-                index = clang.cindex.Index.create()
-                
-                # Parse the file
-                tu = index.parse(temp_path)
-                
-                # Process the abstract syntax tree
-                for cursor in tu.cursor.walk_preorder():
-                    # Get includes
-                    if cursor.kind == CursorKind.INCLUSION_DIRECTIVE:
-                        included_file = cursor.displayname
-                        result['includes'].append(included_file)
-                    
-                    # Get classes
-                    elif cursor.kind == CursorKind.CLASS_DECL:
-                        class_name = cursor.spelling
+            # Reuse the cached clang Index (recreated lazily after pickling)
+            index = self._clang_index
+            if index is None:
+                index = self._clang_index = clang.cindex.Index.create()
+
+            # Parse from the in-memory buffer: no temp file round-trip to
+            # disk, and skipping function bodies spares clang the bulk of
+            # AST construction since only declarations are extracted here
+            tu = index.parse(
+                file_path,
+                unsaved_files=[(file_path, content)],
+                options=clang.cindex.TranslationUnit.PARSE_SKIP_FUNCTION_BODIES
+            )
+
+            # Includes come straight from the preprocessing record; walking
+            # the AST for INCLUSION_DIRECTIVE nodes was pure overhead
+            includes: Set[str] = {
+                os.path.basename(str(inc.include)) for inc in tu.get_includes()
+            }
+            classes: Set[str] = set()
+            functions: Set[str] = set()
+
+            # Class and function declarations only appear at translation-unit
+            # scope or inside namespaces/extern blocks, so a bounded recursion
+            # over those visits orders of magnitude fewer nodes than
+            # walk_preorder (which descends into every statement/expression)
+            def visit(cursor):
+                for child in cursor.get_children():
+                    kind = child.kind
+                    if kind == CursorKind.CLASS_DECL:
+                        class_name = child.spelling
                         if class_name:
-                            result['classes'].append(class_name)
-                    
-                    # Get functions
-                    elif cursor.kind == CursorKind.FUNCTION_DECL:
-                        func_name = cursor.spelling
+                            classes.add(class_name)
+                    elif kind == CursorKind.FUNCTION_DECL:
+                        func_name = child.spelling
                         if func_name:
-                            # Get return type and function name
-                            result_type = cursor.result_type.spelling
-                            result['functions'].append(f"{result_type} {func_name}")
-                
-                # Look for UI elements and components using regex
-                # (libclang doesn't help much with identifying UI-specific patterns)
-                ui_elements = self.ui_element_pattern.findall(content)
-                result['ui_elements'] = list(set(ui_elements))
-                
-                for keyword in self.component_keywords:
-                    if re.search(fr'\b{keyword}\b', content, re.IGNORECASE):
-                        if keyword not in result['components']:
-                            result['components'].append(keyword)
-                
-                # Special case for action buttons
-                if re.search(r'\baction\s*button\b', content, re.IGNORECASE):
-                    if 'action button' not in result['components']:
-                        result['components'].append('action button')
-                
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_path)
-            
+                            result_type = child.result_type.spelling
+                            functions.add(f"{result_type} {func_name}")
+                    elif kind in (CursorKind.NAMESPACE, CursorKind.LINKAGE_SPEC):
+                        visit(child)
+
+            visit(tu.cursor)
+
+            result['includes'] = list(includes)
+            result['classes'] = list(classes)
+            result['functions'] = list(functions)
+
+            # Look for UI elements and components using regex
+            # (libclang doesn't help much with identifying UI-specific patterns)
+            result['ui_elements'], result['components'] = \
+                self._scan_ui_and_components(content)
+
             return result
             
         except ImportError:
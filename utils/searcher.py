@@ -1,570 +1,1151 @@
-import re
-import os
-from typing import List, Dict, Any, Set
-import difflib
-
-class CodebaseSearcher:
-    """Search engine for the indexed codebase."""
-    
-    def __init__(self, indexer):
-        """
-        Initialize the searcher with an indexer.
-        
-        Args:
-            indexer: An instance of CodebaseIndexer with indexed codebase
-        """
-        self.indexer = indexer
-    
-    def search(self, query: str, search_type: str, case_sensitive: bool = False, 
-               file_types: List[str] = None) -> List[Dict[str, Any]]:
-        """
-        Search the codebase based on query and search type.
-        
-        Args:
-            query: Search query string
-            search_type: Type of search (component, function, class, dependency, ui_element)
-            case_sensitive: Whether the search should be case sensitive
-            file_types: List of file extensions to include in search
-            
-        Returns:
-            List of dictionaries containing search results
-        """
-        if not query:
-            return []
-            
-        # Filter file types if specified
-        if file_types:
-            file_filter = lambda f: any(f.endswith(f".{ft}") for ft in file_types)
-        else:
-            file_filter = lambda f: True
-            
-        # Adjust query for case sensitivity
-        if not case_sensitive:
-            search_query = query.lower()
-        else:
-            search_query = query
-            
-        results = []
-        
-        # Search based on type
-        if search_type == "component":
-            results = self._search_components(search_query, case_sensitive, file_filter)
-        elif search_type == "function":
-            results = self._search_functions(search_query, case_sensitive, file_filter)
-        elif search_type == "class":
-            results = self._search_classes(search_query, case_sensitive, file_filter)
-        elif search_type == "dependency":
-            results = self._search_dependencies(search_query, case_sensitive, file_filter)
-        elif search_type == "ui element":
-            results = self._search_ui_elements(search_query, case_sensitive, file_filter)
-        else:
-            # Default to full text search
-            results = self._full_text_search(search_query, case_sensitive, file_filter)
-            
-        return results
-        
-    def regex_search(self, pattern: str, case_sensitive: bool = False, 
-                    file_types: List[str] = None) -> List[Dict[str, Any]]:
-        """
-        Search the codebase using regular expressions.
-        
-        Args:
-            pattern: Regular expression pattern
-            case_sensitive: Whether the search should be case sensitive
-            file_types: List of file extensions to include in search
-            
-        Returns:
-            List of dictionaries containing search results
-        """
-        if not pattern:
-            return []
-            
-        # Filter file types if specified
-        if file_types:
-            file_filter = lambda f: any(f.endswith(f".{ft}") for ft in file_types)
-        else:
-            file_filter = lambda f: True
-            
-        results = []
-        
-        try:
-            # Compile regex pattern
-            if case_sensitive:
-                regex = re.compile(pattern)
-            else:
-                regex = re.compile(pattern, re.IGNORECASE)
-                
-            # Search through all files
-            for file_path, file_info in self.indexer.files.items():
-                if not file_filter(file_path):
-                    continue
-                    
-                content = self.indexer.get_file_content(file_path)
-                
-                # Find all matches
-                for i, line in enumerate(content.splitlines(), 1):
-                    for match in regex.finditer(line):
-                        results.append({
-                            'file': file_path,
-                            'line': i,
-                            'match': line.strip(),
-                            'relevance': 1.0,  # All regex matches are equally relevant
-                            'start': match.start(),
-                            'end': match.end()
-                        })
-        except re.error:
-            # Return empty list if regex is invalid
-            return []
-            
-        return results
-    
-    def _search_components(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
-        """Search for components in the indexed codebase."""
-        results = []
-        
-        # Search through indexed components
-        for component, files in self.indexer.components.items():
-            component_match = component if case_sensitive else component.lower()
-            
-            # Check for matches
-            if query in component_match:
-                relevance = self._calculate_relevance(query, component)
-                
-                for file_path in files:
-                    if not file_filter(file_path):
-                        continue
-                        
-                    # Find specific line where component is mentioned
-                    line_number, line_text = self._find_in_file(file_path, component)
-                    
-                    results.append({
-                        'file': file_path,
-                        'line': line_number,
-                        'match': line_text,
-                        'relevance': relevance
-                    })
-        
-        # Also search file contents for component names
-        text_results = self._full_text_search(query, case_sensitive, file_filter)
-        
-        # Combine and deduplicate results
-        seen_files = {r['file'] for r in results}
-        for result in text_results:
-            if result['file'] not in seen_files:
-                results.append(result)
-                seen_files.add(result['file'])
-        
-        return results
-    
-    def _search_functions(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
-        """Search for functions in the indexed codebase."""
-        results = []
-        
-        # Search through indexed functions
-        for function, files in self.indexer.functions.items():
-            function_match = function if case_sensitive else function.lower()
-            
-            # Check for matches
-            if query in function_match:
-                relevance = self._calculate_relevance(query, function)
-                
-                for file_path in files:
-                    if not file_filter(file_path):
-                        continue
-                        
-                    # Find specific line where function is defined
-                    line_number, line_text = self._find_in_file(file_path, function)
-                    
-                    results.append({
-                        'file': file_path,
-                        'line': line_number,
-                        'match': line_text,
-                        'relevance': relevance
-                    })
-        
-        return results
-    
-    def _search_classes(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
-        """Search for classes in the indexed codebase."""
-        results = []
-        
-        # Search through indexed classes
-        for class_name, files in self.indexer.classes.items():
-            class_match = class_name if case_sensitive else class_name.lower()
-            
-            # Check for matches
-            if query in class_match:
-                relevance = self._calculate_relevance(query, class_name)
-                
-                for file_path in files:
-                    if not file_filter(file_path):
-                        continue
-                        
-                    # Find specific line where class is defined
-                    line_number, line_text = self._find_in_file(file_path, f"class {class_name}")
-                    
-                    results.append({
-                        'file': file_path,
-                        'line': line_number,
-                        'match': line_text,
-                        'relevance': relevance
-                    })
-        
-        return results
-    
-    def _search_dependencies(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
-        """Search for dependencies in the indexed codebase."""
-        results = []
-        
-        # Create a set to track processed files
-        processed_files = set()
-        
-        # Search through all files
-        for file_path, deps in self.indexer.dependencies.items():
-            if not file_filter(file_path):
-                continue
-                
-            file_name = os.path.basename(file_path)
-            file_match = file_name if case_sensitive else file_name.lower()
-            
-            # Check if query matches the file name
-            if query in file_match and file_path not in processed_files:
-                relevance = self._calculate_relevance(query, file_name)
-                processed_files.add(file_path)
-                
-                # Find all files that depend on this file
-                dependent_files = []
-                for dep_file, dep_list in self.indexer.dependencies.items():
-                    if file_path in dep_list:
-                        dependent_files.append(dep_file)
-                
-                # Add result for the file itself
-                results.append({
-                    'file': file_path,
-                    'line': 1,  # Header line
-                    'match': f"File with {len(dependent_files)} dependents",
-                    'relevance': relevance,
-                    'dependent_files': dependent_files
-                })
-                
-                # Add results for dependent files
-                for dep_file in dependent_files:
-                    if not file_filter(dep_file) or dep_file in processed_files:
-                        continue
-                        
-                    # Find the include line
-                    line_number, line_text = self._find_include_in_file(dep_file, file_name)
-                    
-                    if line_number > 0:
-                        results.append({
-                            'file': dep_file,
-                            'line': line_number,
-                            'match': line_text,
-                            'relevance': relevance * 0.9  # Slightly lower relevance
-                        })
-                        processed_files.add(dep_file)
-            
-            # Check if query matches any of the dependencies
-            for dep in deps:
-                dep_name = os.path.basename(dep) if isinstance(dep, str) else dep
-                dep_match = dep_name if case_sensitive else dep_name.lower()
-                
-                if query in dep_match and file_path not in processed_files:
-                    relevance = self._calculate_relevance(query, dep_name)
-                    
-                    # Find the include line
-                    line_number, line_text = self._find_include_in_file(file_path, dep_name)
-                    
-                    if line_number > 0:
-                        results.append({
-                            'file': file_path,
-                            'line': line_number,
-                            'match': line_text,
-                            'relevance': relevance
-                        })
-                        processed_files.add(file_path)
-        
-        return results
-    
-    def _search_ui_elements(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
-        """Search for UI elements in the indexed codebase."""
-        results = []
-        
-        # Search through indexed UI elements
-        for ui_element, files in self.indexer.ui_elements.items():
-            ui_match = ui_element if case_sensitive else ui_element.lower()
-            
-            # Check for matches
-            if query in ui_match:
-                relevance = self._calculate_relevance(query, ui_element)
-                
-                for file_path in files:
-                    if not file_filter(file_path):
-                        continue
-                        
-                    # Find specific line where UI element is mentioned
-                    line_number, line_text = self._find_in_file(file_path, ui_element)
-                    
-                    results.append({
-                        'file': file_path,
-                        'line': line_number,
-                        'match': line_text,
-                        'relevance': relevance
-                    })
-        
-        # Also search file contents for UI element names
-        text_results = self._full_text_search(query, case_sensitive, file_filter)
-        
-        # Combine and deduplicate results
-        seen_files = {r['file'] for r in results}
-        for result in text_results:
-            if result['file'] not in seen_files:
-                results.append(result)
-                seen_files.add(result['file'])
-        
-        return results
-    
-    def _full_text_search(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
-        """Search for query in the full text of files."""
-        results = []
-        
-        # Search through all files
-        for file_path in self.indexer.files:
-            if not file_filter(file_path):
-                continue
-                
-            content = self.indexer.get_file_content(file_path)
-            
-            # Convert content to lowercase if not case sensitive
-            if not case_sensitive:
-                search_content = content.lower()
-            else:
-                search_content = content
-            
-            # Check if the query appears in the content
-            if query in search_content:
-                # Find all occurrences
-                lines = content.splitlines()
-                search_lines = search_content.splitlines()
-                
-                for i, (line, search_line) in enumerate(zip(lines, search_lines), 1):
-                    if query in search_line:
-                        # Calculate relevance based on how well the query matches the line
-                        relevance = self._calculate_text_relevance(query, line)
-                        
-                        results.append({
-                            'file': file_path,
-                            'line': i,
-                            'match': line.strip(),
-                            'relevance': relevance
-                        })
-        
-        return results
-    
-    def _calculate_relevance(self, query: str, target: str) -> float:
-        """Calculate relevance score for a match based on how well the query matches the target."""
-        # Normalize strings
-        query_norm = query.lower()
-        target_norm = target.lower()
-        
-        # Exact match gets highest relevance
-        if query_norm == target_norm:
-            return 1.0
-        
-        # Calculate string similarity using difflib
-        similarity = difflib.SequenceMatcher(None, query_norm, target_norm).ratio()
-        
-        # Adjust relevance based on whether the query is a substring of the target
-        if query_norm in target_norm:
-            # Prefix match (starts with) gets higher relevance
-            if target_norm.startswith(query_norm):
-                return 0.9
-            # Word boundary match gets medium-high relevance
-            elif f" {query_norm}" in target_norm or target_norm.endswith(query_norm):
-                return 0.8
-            # Substring match gets medium relevance
-            else:
-                return 0.7
-        
-        # Partial match based on similarity
-        return max(0.3, similarity)
-    
-    def _calculate_text_relevance(self, query: str, line: str) -> float:
-        """Calculate relevance score for a text search match."""
-        # Normalize strings
-        query_norm = query.lower()
-        line_norm = line.lower()
-        
-        # Calculate string similarity
-        similarity = difflib.SequenceMatcher(None, query_norm, line_norm).ratio()
-        
-        # Count occurrences of the query in the line
-        occurrences = line_norm.count(query_norm)
-        
-        # Adjust relevance based on occurrences and similarity
-        if occurrences > 1:
-            return min(1.0, 0.6 + (occurrences * 0.1) + (similarity * 0.3))
-        else:
-            return min(1.0, 0.5 + (similarity * 0.5))
-    
-    def _find_in_file(self, file_path: str, search_text: str) -> tuple:
-        """Find a specific text in a file and return line number and text."""
-        content = self.indexer.get_file_content(file_path)
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines, 1):
-            if search_text in line:
-                return i, line.strip()
-        
-        return 1, ""  # Default to first line if not found
-    
-    def _find_include_in_file(self, file_path: str, include_name: str) -> tuple:
-        """Find a specific include directive in a file."""
-        content = self.indexer.get_file_content(file_path)
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines, 1):
-            if "#include" in line and include_name in line:
-                return i, line.strip()
-        
-        return 0, ""  # Not found
-    
-    def find_related_components(self, file_path: str) -> List[Dict[str, Any]]:
-        """Find components related to the given file."""
-        if not file_path or file_path not in self.indexer.files:
-            return []
-            
-        related = []
-        
-        # Find dependencies
-        if file_path in self.indexer.dependencies:
-            for dep in self.indexer.dependencies[file_path]:
-                related.append({
-                    'file': dep,
-                    'relationship': 'dependency'
-                })
-        
-        # Find dependents (files that include this file)
-        for dep_file, deps in self.indexer.dependencies.items():
-            if file_path in deps:
-                related.append({
-                    'file': dep_file,
-                    'relationship': 'dependent'
-                })
-        
-        # Find files with similar components
-        file_components = set()
-        for comp, files in self.indexer.components.items():
-            if file_path in files:
-                file_components.add(comp)
-        
-        if file_components:
-            for comp in file_components:
-                for comp_file in self.indexer.components.get(comp, []):
-                    if comp_file != file_path:
-                        related.append({
-                            'file': comp_file,
-                            'relationship': f'shares component: {comp}'
-                        })
-        
-        # Find files with similar classes
-        file_classes = set()
-        for cls, files in self.indexer.classes.items():
-            if file_path in files:
-                file_classes.add(cls)
-        
-        if file_classes:
-            for cls in file_classes:
-                for cls_file in self.indexer.classes.get(cls, []):
-                    if cls_file != file_path:
-                        related.append({
-                            'file': cls_file,
-                            'relationship': f'shares class: {cls}'
-                        })
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        deduped = []
-        for item in related:
-            key = item['file']
-            if key not in seen:
-                seen.add(key)
-                deduped.append(item)
-        
-        return deduped
-    
-    def find_usage_examples(self, file_path: str, max_examples: int = 5) -> List[Dict[str, Any]]:
-        """Find usage examples for components defined in the given file."""
-        if not file_path or file_path not in self.indexer.files:
-            return []
-            
-        examples = []
-        
-        # Find components defined in this file
-        file_components = set()
-        for comp, files in self.indexer.components.items():
-            if file_path in files:
-                file_components.add(comp)
-        
-        # Find classes defined in this file
-        file_classes = set()
-        for cls, files in self.indexer.classes.items():
-            if file_path in files:
-                file_classes.add(cls)
-        
-        # Get usage examples for components
-        for comp in file_components:
-            for comp_file in self.indexer.components.get(comp, []):
-                if comp_file != file_path:
-                    content = self.indexer.get_file_content(comp_file)
-                    
-                    # Extract a snippet around the component usage
-                    snippet = self._extract_code_snippet(content, comp)
-                    
-                    if snippet:
-                        examples.append({
-                            'file': comp_file,
-                            'code': snippet,
-                            'type': 'component',
-                            'name': comp
-                        })
-                        
-                        if len(examples) >= max_examples:
-                            return examples
-        
-        # Get usage examples for classes
-        for cls in file_classes:
-            for cls_file in self.indexer.classes.get(cls, []):
-                if cls_file != file_path:
-                    content = self.indexer.get_file_content(cls_file)
-                    
-                    # Extract a snippet around the class usage
-                    snippet = self._extract_code_snippet(content, cls)
-                    
-                    if snippet:
-                        examples.append({
-                            'file': cls_file,
-                            'code': snippet,
-                            'type': 'class',
-                            'name': cls
-                        })
-                        
-                        if len(examples) >= max_examples:
-                            return examples
-        
-        return examples
-    
-    def _extract_code_snippet(self, content: str, search_text: str, context_lines: int = 5) -> str:
-        """Extract a code snippet around a search text with context lines."""
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines):
-            if search_text in line:
-                # Determine start and end lines for the snippet
-                start = max(0, i - context_lines)
-                end = min(len(lines), i + context_lines + 1)
-                
-                # Extract the snippet
-                return "\n".join(lines[start:end])
-        
-        return ""
+import re
+import os
+import bisect
+import functools
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from typing import List, Dict, Any, Set
+import difflib
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Optional C-backed multi-pattern matcher (same guarded import as the
+# parser): all known component/UI names are found in one pass per file
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Identifier-shaped tokens, the unit of the full-text inverted index
+_TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Bound on the per-file lowercase/line cache
+_LC_CACHE_MAX_ENTRIES = 512
+
+# Bound on the cached top-level search results
+_RESULT_CACHE_MAX_ENTRIES = 128
+
+# Fallback scans go parallel at this many files; the hot inner calls
+# (str.lower, substring find) release the GIL in C
+PARALLEL_SCAN_THRESHOLD = 64
+SCAN_THREADS = 32
+
+# Bits per per-file token Bloom filter (8 KB bitset each, 2 hash probes,
+# same scheme as the indexer's basename filter)
+_BLOOM_BITS = 1 << 16
+
+
+def _bloom_add(bloom: bytearray, token: str):
+    """Record a token in a file's Bloom filter."""
+    h = hash(token)
+    for index in (h & (_BLOOM_BITS - 1), (h >> 16) & (_BLOOM_BITS - 1)):
+        bloom[index >> 3] |= 1 << (index & 7)
+
+
+def _bloom_may_contain(bloom: bytearray, token: str) -> bool:
+    """Check a file's Bloom filter; False means the token is definitely absent."""
+    h = hash(token)
+    for index in (h & (_BLOOM_BITS - 1), (h >> 16) & (_BLOOM_BITS - 1)):
+        if not bloom[index >> 3] & (1 << (index & 7)):
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def _similarity(a: str, b: str) -> float:
+    """Cached sequence similarity for repeated (query, text) pairs."""
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+@functools.lru_cache(maxsize=4096)
+def _floored_similarity(a: str, b: str) -> float:
+    """Similarity clamped to the 0.3 relevance floor.
+
+    real_quick_ratio/quick_ratio are monotone upper bounds, so when even
+    the optimistic estimate cannot clear the floor the quadratic ratio()
+    pass is skipped entirely.
+    """
+    matcher = difflib.SequenceMatcher(None, a, b)
+    if matcher.real_quick_ratio() <= 0.3 or matcher.quick_ratio() <= 0.3:
+        return 0.3
+    return max(0.3, matcher.ratio())
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str, case_sensitive: bool):
+    """Compile a user pattern once per (pattern, case) pair; prefer RE2.
+
+    MULTILINE keeps ^/$ anchored to lines over the concatenated corpus,
+    matching the per-line scan the corpus pass replaced.
+    """
+    if re2 is not None:
+        flags = re2.MULTILINE | (0 if case_sensitive else re2.IGNORECASE)
+        return re2.compile(pattern, flags)
+    flags = re.MULTILINE | (0 if case_sensitive else re.IGNORECASE)
+    return re.compile(pattern, flags)
+
+
+class CodebaseSearcher:
+    """Search engine for the indexed codebase."""
+
+    def __init__(self, indexer):
+        """
+        Initialize the searcher with an indexer.
+
+        Args:
+            indexer: An instance of CodebaseIndexer with indexed codebase
+        """
+        self.indexer = indexer
+
+        # Concatenated corpus for regex scans, rebuilt when the index changes
+        self._corpus = None  # All file contents joined into one string
+        self._corpus_file_starts = []  # Start offset of each file in the corpus
+        self._corpus_file_ends = []  # End offset of each file's own content
+        self._corpus_files = []  # File path per corpus segment
+        self._corpus_line_starts = []  # Offset of every line start in the corpus
+        self._corpus_lines_before = []  # Number of corpus lines before each file
+        self._corpus_version = None
+
+        # Inverted index for full-text search: lowercase token -> list of
+        # (file_id, line_number) postings, refreshed incrementally for files
+        # the indexer marks dirty; the per-file token sets make removal of a
+        # single file's postings targeted
+        self._postings = None
+        self._postings_tokens = None
+        self._postings_version = None
+
+        # Per-file Bloom filter over tokens: the fallback scan probes it to
+        # skip files without touching their content
+        self._file_blooms = None
+        self._blooms_version = None
+
+        # Per-file (lowered content, lines, lowered lines), LRU-bounded;
+        # each entry is tagged with the version it was built at and stays
+        # valid until the indexer's dirty tracking says its file changed.
+        # The lock keeps the OrderedDict consistent under the parallel scan.
+        self._lc_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lc_lock = threading.Lock()
+
+        # Interactive UIs re-issue the same query on every rerun; cache the
+        # final result lists keyed by normalized arguments + indexer version
+        self._result_cache: "OrderedDict[tuple, list]" = OrderedDict()
+
+        # Secondary index of known component/UI name occurrences, built from
+        # one Aho-Corasick pass per file when the extension is available
+        self._name_automaton = None
+        self._name_occurrences = None
+        self._names_version = None
+
+        # (file, symbol) -> (line, text), so a query matching many symbols
+        # that share files resolves each location once
+        self._symbol_location_cache: Dict[tuple, tuple] = {}
+        self._symbol_locations_version = None
+
+        # SoA symbol tables per kind: NUL-joined lowered blob plus parallel
+        # offsets/keys/files arrays, scanned with str.find per query
+        self._symbols_soa = None
+        self._symbols_soa_version = None
+
+        # Per-file line-start offsets for offset-to-line translation
+        self._line_starts_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+    @staticmethod
+    def _merge_results(results: List[Dict[str, Any]],
+                       text_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge result streams in one pass, keyed by (file, line).
+
+        Keeps the highest-relevance entry per location, so a strong
+        line-level text match is no longer dropped just because the file
+        already appeared with a weaker symbol match.
+        """
+        merged: Dict[tuple, Dict[str, Any]] = {}
+        for result in results:
+            key = (result['file'], result.get('line', 1))
+            prev = merged.get(key)
+            if prev is None or result['relevance'] > prev['relevance']:
+                merged[key] = result
+        for result in text_results:
+            key = (result['file'], result.get('line', 1))
+            prev = merged.get(key)
+            if prev is None or result['relevance'] > prev['relevance']:
+                merged[key] = result
+        return list(merged.values())
+
+    def _cached_result(self, key):
+        """Return a shallow copy of a cached result list, or None."""
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        self._result_cache.move_to_end(key)
+        return list(cached)
+
+    def _store_result(self, key, results: List[Dict[str, Any]]):
+        """Cache a result list, evicting the oldest entry when full."""
+        self._result_cache[key] = list(results)
+        if len(self._result_cache) > _RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
+    def _get_corpus(self):
+        """Build (or reuse) the concatenated corpus and its offset tables."""
+        if self._corpus is not None and self._corpus_version == self.indexer.version:
+            return self._corpus
+
+        parts = []
+        file_starts = []
+        file_ends = []
+        files = []
+        pos = 0
+
+        for file_path in self.indexer.files:
+            content = self.indexer.get_file_content(file_path)
+            if not content.endswith('\n'):
+                content += '\n'
+            file_starts.append(pos)
+            files.append(file_path)
+            parts.append(content)
+            pos += len(content)
+            file_ends.append(pos)
+            # NUL line between files: no user pattern crosses it unnoticed,
+            # and regex_search drops matches outside their file's range
+            parts.append('\0\n')
+            pos += 2
+
+        corpus = ''.join(parts)
+
+        # Offset of every line start, for O(log n) offset-to-line translation
+        line_starts = [0]
+        find = corpus.find
+        i = find('\n')
+        while i != -1:
+            line_starts.append(i + 1)
+            i = find('\n', i + 1)
+
+        # Number of lines before each file, to translate to per-file line numbers
+        lines_before = [bisect.bisect_right(line_starts, start) - 1 for start in file_starts]
+
+        self._corpus = corpus
+        self._corpus_file_starts = file_starts
+        self._corpus_file_ends = file_ends
+        self._corpus_files = files
+        self._corpus_line_starts = line_starts
+        self._corpus_lines_before = lines_before
+        self._corpus_version = self.indexer.version
+        return corpus
+    
+    def search(self, query: str, search_type: str, case_sensitive: bool = False, 
+               file_types: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Search the codebase based on query and search type.
+        
+        Args:
+            query: Search query string
+            search_type: Type of search (component, function, class, dependency, ui_element)
+            case_sensitive: Whether the search should be case sensitive
+            file_types: List of file extensions to include in search
+            
+        Returns:
+            List of dictionaries containing search results
+        """
+        if not query:
+            return []
+
+        key = ('search', query, search_type, case_sensitive,
+               tuple(sorted(file_types or ())), self.indexer.version)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+
+        # Filter file types if specified
+        if file_types:
+            file_filter = lambda f: any(f.endswith(f".{ft}") for ft in file_types)
+        else:
+            file_filter = lambda f: True
+
+        # Adjust query for case sensitivity
+        if not case_sensitive:
+            search_query = query.lower()
+        else:
+            search_query = query
+            
+        results = []
+        
+        # Search based on type
+        if search_type == "component":
+            results = self._search_components(search_query, case_sensitive, file_filter)
+        elif search_type == "function":
+            results = self._search_functions(search_query, case_sensitive, file_filter)
+        elif search_type == "class":
+            results = self._search_classes(search_query, case_sensitive, file_filter)
+        elif search_type == "dependency":
+            results = self._search_dependencies(search_query, case_sensitive, file_filter)
+        elif search_type == "ui element":
+            results = self._search_ui_elements(search_query, case_sensitive, file_filter)
+        else:
+            # Default to full text search
+            results = self._full_text_search(search_query, case_sensitive, file_filter)
+
+        self._store_result(key, results)
+        return results
+        
+    def regex_search(self, pattern: str, case_sensitive: bool = False, 
+                    file_types: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Search the codebase using regular expressions.
+        
+        Args:
+            pattern: Regular expression pattern
+            case_sensitive: Whether the search should be case sensitive
+            file_types: List of file extensions to include in search
+            
+        Returns:
+            List of dictionaries containing search results
+        """
+        if not pattern:
+            return []
+
+        key = ('regex', pattern, case_sensitive,
+               tuple(sorted(file_types or ())), self.indexer.version)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+
+        # Filter file types if specified
+        if file_types:
+            file_filter = lambda f: any(f.endswith(f".{ft}") for ft in file_types)
+        else:
+            file_filter = lambda f: True
+            
+        try:
+            # Cached compile: repeat patterns skip re-compilation entirely
+            regex = _compile(pattern, case_sensitive)
+        except Exception:
+            # Return empty list if regex is invalid
+            return []
+
+        results = []
+
+        # One C-level scan over the whole corpus instead of a Python loop
+        # per file and per line
+        corpus = self._get_corpus()
+        file_starts = self._corpus_file_starts
+        file_ends = self._corpus_file_ends
+        line_starts = self._corpus_line_starts
+
+        for match in regex.finditer(corpus):
+            offset = match.start()
+
+            file_index = bisect.bisect_right(file_starts, offset) - 1
+            # Drop matches that start on a separator line or run past their
+            # file's own content: the corpus is one string, but a match
+            # crossing a file boundary exists in no actual file
+            if offset >= file_ends[file_index] or match.end() > file_ends[file_index]:
+                continue
+            file_path = self._corpus_files[file_index]
+            if not file_filter(file_path):
+                continue
+
+            line_index = bisect.bisect_right(line_starts, offset) - 1
+            line_start = line_starts[line_index]
+            line_end = corpus.find('\n', line_start)
+            if line_end == -1:
+                line_end = len(corpus)
+            line = corpus[line_start:line_end]
+
+            results.append({
+                'file': file_path,
+                'line': line_index - self._corpus_lines_before[file_index] + 1,
+                'match': line.strip(),
+                'relevance': 1.0,  # All regex matches are equally relevant
+                'start': offset - line_start,
+                'end': match.end() - line_start
+            })
+
+        self._store_result(key, results)
+        return results
+    
+    def _get_symbol_soa(self):
+        """Symbol tables in SoA layout, rebuilt when the index changes.
+
+        Per kind: (blob, offsets, keys, files_list). blob is every lowered
+        name joined with NUL separators, so candidate names are found with
+        a single C-level str.find scan instead of a Python loop over
+        (lowered, original) tuples; offsets maps a hit position back to the
+        parallel keys/files_list arrays via bisect.
+        """
+        if self._symbols_soa is not None and self._symbols_soa_version == self.indexer.version:
+            return self._symbols_soa
+
+        tables = {}
+        for kind, mapping in (
+            ('components', self.indexer.components),
+            ('functions', self.indexer.functions),
+            ('classes', self.indexer.classes),
+            ('ui_elements', self.indexer.ui_elements),
+        ):
+            keys = list(mapping)
+            files_list = list(mapping.values())
+            lowered = [key.lower() for key in keys]
+            offsets = []
+            pos = 0
+            for key_lc in lowered:
+                offsets.append(pos)
+                pos += len(key_lc) + 1
+            tables[kind] = ('\0'.join(lowered), offsets, keys, files_list)
+
+        self._symbols_soa = tables
+        self._symbols_soa_version = self.indexer.version
+        return self._symbols_soa
+
+    def _iter_symbol_matches(self, kind: str, query: str, case_sensitive: bool):
+        """Yield (name, files) for indexed names of a kind containing the query."""
+        blob, offsets, keys, files_list = self._get_symbol_soa()[kind]
+        needle = query.lower() if case_sensitive else query
+        if not needle or '\0' in needle:
+            return
+
+        pos = blob.find(needle)
+        while pos != -1:
+            idx = bisect.bisect_right(offsets, pos) - 1
+            # Further hits inside the same name identify the same symbol, so
+            # resume the scan at the next name boundary
+            end = offsets[idx + 1] - 1 if idx + 1 < len(offsets) else len(blob)
+            name = keys[idx]
+            if not case_sensitive or query in name:
+                yield name, files_list[idx]
+            pos = blob.find(needle, end)
+
+    def _get_name_automaton(self):
+        """Build (or reuse) the automaton over known component/UI names."""
+        if ahocorasick is None:
+            return None
+        if self._name_automaton is not None and self._names_version == self.indexer.version:
+            return self._name_automaton
+
+        auto = None
+        names = set(self.indexer.components) | set(self.indexer.ui_elements)
+        if names:
+            # Several names can share a lowered form (e.g. 'Button' the UI
+            # element and 'button' the component keyword), so each automaton
+            # key carries every original spelling
+            by_lower: Dict[str, List[str]] = {}
+            for name in names:
+                by_lower.setdefault(name.lower(), []).append(name)
+            auto = ahocorasick.Automaton()
+            for lowered, originals in by_lower.items():
+                auto.add_word(lowered, tuple(originals))
+            auto.make_automaton()
+        self._name_automaton = auto
+        self._name_occurrences = None
+        self._names_version = self.indexer.version
+        return auto
+
+    def scan_file_for_known_names(self, file_path: str) -> Dict[str, List[int]]:
+        """Find every known component/UI name in a file in one linear pass."""
+        auto = self._get_name_automaton()
+        if auto is None:
+            return {}
+        found: Dict[str, List[int]] = {}
+        _, _, lower_lines = self._get_lc(file_path)
+        for line_no, line in enumerate(lower_lines, 1):
+            for _end, names in auto.iter(line):
+                for name in names:
+                    lines = found.setdefault(name, [])
+                    if not lines or lines[-1] != line_no:
+                        lines.append(line_no)
+        return found
+
+    def _get_name_occurrences(self):
+        """name -> {file_id: [line numbers]} across all indexed files."""
+        if ahocorasick is None:
+            return None
+        if self._name_occurrences is not None and self._names_version == self.indexer.version:
+            return self._name_occurrences
+
+        occurrences: Dict[str, Dict[int, List[int]]] = {}
+        if self._get_name_automaton() is not None:
+            for file_path in self.indexer.files:
+                file_id = self.indexer.path_id(file_path)
+                for name, line_nos in self.scan_file_for_known_names(file_path).items():
+                    occurrences.setdefault(name, {})[file_id] = line_nos
+        self._name_occurrences = occurrences
+        return occurrences
+
+    def _locate_known_name(self, file_path: str, name: str, occurrences) -> tuple:
+        """Locate a known name in a file via the secondary index."""
+        if occurrences is None:
+            return self._find_in_file(file_path, name)
+        line_nos = occurrences.get(name, {}).get(self.indexer.path_id(file_path))
+        if line_nos:
+            _, lines, _ = self._get_lc(file_path)
+            # Candidates are case-insensitive automaton hits; keep the
+            # exact-substring semantics of the per-line scan
+            for line_no in line_nos:
+                if line_no <= len(lines) and name in lines[line_no - 1]:
+                    return line_no, lines[line_no - 1].strip()
+        return 1, ""  # Default to first line if not found
+
+    def _search_components(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
+        """Search for components in the indexed codebase."""
+        results = []
+        occurrences = self._get_name_occurrences()
+
+        # Candidate components come from one find scan over the SoA blob
+        for component, files in self._iter_symbol_matches('components', query, case_sensitive):
+            relevance = self._calculate_relevance(query, component)
+
+            for file_path in self.indexer.paths_for(files):
+                if not file_filter(file_path):
+                    continue
+
+                # Find specific line where component is mentioned
+                line_number, line_text = self._locate_known_name(
+                    file_path, component, occurrences)
+
+                results.append({
+                    'file': file_path,
+                    'line': line_number,
+                    'match': line_text,
+                    'relevance': relevance
+                })
+        
+        # Also search file contents for component names
+        text_results = self._full_text_search(query, case_sensitive, file_filter)
+
+        return self._merge_results(results, text_results)
+    
+    def _search_functions(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
+        """Search for functions in the indexed codebase."""
+        results = []
+        
+        # Candidate functions come from one find scan over the SoA blob
+        for function, files in self._iter_symbol_matches('functions', query, case_sensitive):
+            relevance = self._calculate_relevance(query, function)
+
+            for file_path in self.indexer.paths_for(files):
+                if not file_filter(file_path):
+                    continue
+
+                # Find specific line where function is defined
+                line_number, line_text = self._locate_symbol(file_path, function)
+
+                results.append({
+                    'file': file_path,
+                    'line': line_number,
+                    'match': line_text,
+                    'relevance': relevance
+                })
+        
+        return results
+    
+    def _search_classes(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
+        """Search for classes in the indexed codebase."""
+        results = []
+        
+        # Candidate classes come from one find scan over the SoA blob
+        for class_name, files in self._iter_symbol_matches('classes', query, case_sensitive):
+            relevance = self._calculate_relevance(query, class_name)
+
+            for file_path in self.indexer.paths_for(files):
+                if not file_filter(file_path):
+                    continue
+
+                # Find specific line where class is defined
+                line_number, line_text = self._locate_symbol(file_path, f"class {class_name}")
+
+                results.append({
+                    'file': file_path,
+                    'line': line_number,
+                    'match': line_text,
+                    'relevance': relevance
+                })
+        
+        return results
+    
+    def _search_dependencies(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
+        """Search for dependencies in the indexed codebase."""
+        results = []
+        
+        # Create a set to track processed files
+        processed_files = set()
+
+        # Dependents come from the indexer's prebuilt reverse map instead of
+        # rescanning every file's dependency list per matching file
+        reverse_deps = self.indexer.reverse_dependencies()
+
+        # Search through all files
+        for file_path, deps in self.indexer.dependencies.items():
+            if not file_filter(file_path):
+                continue
+                
+            file_name = os.path.basename(file_path)
+            file_match = file_name if case_sensitive else file_name.lower()
+            
+            # Check if query matches the file name
+            if query in file_match and file_path not in processed_files:
+                relevance = self._calculate_relevance(query, file_name)
+                processed_files.add(file_path)
+                
+                # Find all files that depend on this file
+                dependent_files = list(reverse_deps.get(file_path, ()))
+                
+                # Add result for the file itself
+                results.append({
+                    'file': file_path,
+                    'line': 1,  # Header line
+                    'match': f"File with {len(dependent_files)} dependents",
+                    'relevance': relevance,
+                    'dependent_files': dependent_files
+                })
+                
+                # Add results for dependent files
+                for dep_file in dependent_files:
+                    if not file_filter(dep_file) or dep_file in processed_files:
+                        continue
+                        
+                    # Find the include line
+                    line_number, line_text = self._find_include_in_file(dep_file, file_name)
+                    
+                    if line_number > 0:
+                        results.append({
+                            'file': dep_file,
+                            'line': line_number,
+                            'match': line_text,
+                            'relevance': relevance * 0.9  # Slightly lower relevance
+                        })
+                        processed_files.add(dep_file)
+            
+            # Check if query matches any of the dependencies
+            for dep in deps:
+                dep_name = os.path.basename(dep) if isinstance(dep, str) else dep
+                dep_match = dep_name if case_sensitive else dep_name.lower()
+                
+                if query in dep_match and file_path not in processed_files:
+                    relevance = self._calculate_relevance(query, dep_name)
+                    
+                    # Find the include line
+                    line_number, line_text = self._find_include_in_file(file_path, dep_name)
+                    
+                    if line_number > 0:
+                        results.append({
+                            'file': file_path,
+                            'line': line_number,
+                            'match': line_text,
+                            'relevance': relevance
+                        })
+                        processed_files.add(file_path)
+        
+        return results
+    
+    def _search_ui_elements(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
+        """Search for UI elements in the indexed codebase."""
+        results = []
+        occurrences = self._get_name_occurrences()
+
+        # Candidate UI elements come from one find scan over the SoA blob
+        for ui_element, files in self._iter_symbol_matches('ui_elements', query, case_sensitive):
+            relevance = self._calculate_relevance(query, ui_element)
+
+            for file_path in self.indexer.paths_for(files):
+                if not file_filter(file_path):
+                    continue
+
+                # Find specific line where UI element is mentioned
+                line_number, line_text = self._locate_known_name(
+                    file_path, ui_element, occurrences)
+
+                results.append({
+                    'file': file_path,
+                    'line': line_number,
+                    'match': line_text,
+                    'relevance': relevance
+                })
+        
+        # Also search file contents for UI element names
+        text_results = self._full_text_search(query, case_sensitive, file_filter)
+
+        return self._merge_results(results, text_results)
+    
+    def _file_entry_current(self, file_path: str, cached_version) -> bool:
+        """Whether a per-file cache entry from cached_version is still valid.
+
+        The indexer's dirty tracking records when each file last changed, so
+        an entry for an untouched file survives unrelated version bumps
+        instead of being recomputed to identical values.
+        """
+        version = self.indexer.version
+        if cached_version == version:
+            return True
+        if cached_version < self.indexer.full_index_version:
+            return False
+        return self.indexer.dirty_files.get(file_path, 0) <= cached_version
+
+    def _get_lc(self, file_path: str):
+        """Return cached (lowered content, lines, lowered lines) for a file."""
+        version = self.indexer.version
+        with self._lc_lock:
+            entry = self._lc_cache.get(file_path)
+            if entry is not None and self._file_entry_current(file_path, entry[0]):
+                self._lc_cache.move_to_end(file_path)
+                return entry[1], entry[2], entry[3]
+
+        # Computed outside the lock; a racing duplicate is benign
+        content = self.indexer.get_file_content(file_path)
+        lower = content.lower()
+        lines = content.splitlines()
+        lower_lines = lower.splitlines()
+        with self._lc_lock:
+            self._lc_cache[file_path] = (version, lower, lines, lower_lines)
+            if len(self._lc_cache) > _LC_CACHE_MAX_ENTRIES:
+                self._lc_cache.popitem(last=False)
+        return lower, lines, lower_lines
+
+    def _get_postings(self):
+        """Build or incrementally refresh the token -> [(file_id, line_no)] index."""
+        version = self.indexer.version
+        if self._postings is not None and self._postings_version == version:
+            return self._postings
+
+        changed = None
+        if self._postings is not None:
+            changed = self.indexer.changed_since(self._postings_version)
+
+        if changed is None:
+            postings: Dict[str, List[tuple]] = {}
+            file_tokens: Dict[int, set] = {}
+            to_index = self.indexer.files
+        else:
+            # Only the files the indexer marked dirty are rescanned; their
+            # old postings are dropped first via the per-file token sets
+            postings = self._postings
+            file_tokens = self._postings_tokens
+            for file_path in changed:
+                file_id = self.indexer.path_id(file_path)
+                if file_id is None:
+                    continue
+                for token in file_tokens.pop(file_id, ()):
+                    plist = postings.get(token)
+                    if plist is None:
+                        continue
+                    plist[:] = [entry for entry in plist if entry[0] != file_id]
+                    if not plist:
+                        del postings[token]
+            to_index = [path for path in changed if path in self.indexer.files]
+
+        findall = _TOKEN_RE.findall
+        for file_path in to_index:
+            file_id = self.indexer.path_id(file_path)
+            content = self.indexer.get_file_content(file_path)
+            tokens = file_tokens.setdefault(file_id, set())
+            for line_no, line in enumerate(content.lower().splitlines(), 1):
+                for token in set(findall(line)):
+                    postings.setdefault(token, []).append((file_id, line_no))
+                    tokens.add(token)
+
+        self._postings = postings
+        self._postings_tokens = file_tokens
+        self._postings_version = version
+        return postings
+
+    def _full_text_search(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
+        """Search for query in the full text of files."""
+        # Identifier-shaped queries go through the inverted index: candidate
+        # lines come from postings of every vocabulary token containing the
+        # query, so substring-of-identifier matches are preserved. Other
+        # queries (whitespace, punctuation) fall back to the linear scan.
+        if not _TOKEN_RE.fullmatch(query):
+            return self._full_text_scan(query, case_sensitive, file_filter)
+
+        postings = self._get_postings()
+        query_lower = query.lower()
+
+        candidates = set()
+        for token, plist in postings.items():
+            if query_lower in token:
+                candidates.update(plist)
+
+        results = []
+        for file_id, line_no in sorted(candidates):
+            file_path = self.indexer.path_for_id(file_id)
+            if not file_filter(file_path):
+                continue
+
+            _, lines, _ = self._get_lc(file_path)
+            if line_no > len(lines):
+                continue
+            line = lines[line_no - 1]
+
+            # Verify against the real line: postings are lowercased, so
+            # case-sensitive queries still need the exact check
+            if case_sensitive and query not in line:
+                continue
+
+            results.append({
+                'file': file_path,
+                'line': line_no,
+                'match': line.strip(),
+                'relevance': self._calculate_text_relevance(query, line)
+            })
+
+        return results
+
+    def _get_file_blooms(self):
+        """Build or incrementally refresh the per-file token Bloom filters."""
+        version = self.indexer.version
+        if self._file_blooms is not None and self._blooms_version == version:
+            return self._file_blooms
+
+        changed = None
+        if self._file_blooms is not None:
+            changed = self.indexer.changed_since(self._blooms_version)
+
+        if changed is None:
+            blooms = {}
+            to_index = self.indexer.files
+        else:
+            # The filters are independent per file, so only dirty files
+            # need their bloom recomputed (or dropped, if deleted)
+            blooms = self._file_blooms
+            for file_path in changed:
+                blooms.pop(file_path, None)
+            to_index = [path for path in changed if path in self.indexer.files]
+
+        findall = _TOKEN_RE.findall
+        for file_path in to_index:
+            lower, _, _ = self._get_lc(file_path)
+            bloom = bytearray(_BLOOM_BITS >> 3)
+            for token in set(findall(lower)):
+                _bloom_add(bloom, token)
+            blooms[file_path] = bloom
+
+        self._file_blooms = blooms
+        self._blooms_version = version
+        return blooms
+
+    def _full_text_scan(self, query: str, case_sensitive: bool, file_filter) -> List[Dict[str, Any]]:
+        """Linear fallback scan for queries the inverted index can't serve."""
+        results = []
+
+        # A file containing the query literally must contain every identifier
+        # token that is fully delimited inside it (tokens touching the query
+        # edges could extend further in the file, so they can't be probed).
+        # Probing those against the per-file Bloom filters rejects most files
+        # without touching their content.
+        query_lower = query.lower()
+        query_tokens = [m.group() for m in _TOKEN_RE.finditer(query_lower)
+                        if m.start() > 0 and m.end() < len(query_lower)]
+        blooms = self._get_file_blooms() if query_tokens else None
+
+        # Bloom-screened candidate list
+        candidates = []
+        for file_path in self.indexer.files:
+            if not file_filter(file_path):
+                continue
+            if blooms is not None:
+                bloom = blooms.get(file_path)
+                if bloom is not None and not all(
+                        _bloom_may_contain(bloom, token) for token in query_tokens):
+                    continue
+            candidates.append(file_path)
+
+        # Files scan independently and the hot inner calls release the GIL,
+        # so large candidate sets fan out over threads (same threshold idea
+        # as the indexer's parallel parse)
+        if len(candidates) >= PARALLEL_SCAN_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=SCAN_THREADS) as executor:
+                for file_results in executor.map(
+                        lambda f: self._scan_one_file(f, query, case_sensitive),
+                        candidates):
+                    results.extend(file_results)
+        else:
+            for file_path in candidates:
+                results.extend(self._scan_one_file(file_path, query, case_sensitive))
+
+        return results
+
+    def _scan_one_file(self, file_path: str, query: str, case_sensitive: bool) -> List[Dict[str, Any]]:
+        """Scan a single file for the query; the unit of the parallel scan."""
+        # Cached lowercase copy: the per-query content.lower() was a full
+        # reallocation of every file on every search
+        lower, lines, lower_lines = self._get_lc(file_path)
+        if not case_sensitive:
+            search_content = lower
+            search_lines = lower_lines
+        else:
+            search_content = self.indexer.get_file_content(file_path)
+            search_lines = lines
+
+        # Check if the query appears in the content
+        if query not in search_content:
+            return []
+
+        # Two batched phases — gather matches, then score — instead of
+        # interleaving dict construction per line
+        matched = [
+            (i, line)
+            for i, (line, search_line) in enumerate(zip(lines, search_lines), 1)
+            if query in search_line
+        ]
+        score = self._calculate_text_relevance
+        return [
+            {
+                'file': file_path,
+                'line': i,
+                'match': line.strip(),
+                'relevance': score(query, line)
+            }
+            for i, line in matched
+        ]
+    
+    def _calculate_relevance(self, query: str, target: str) -> float:
+        """Calculate relevance score for a match based on how well the query matches the target."""
+        # Normalize strings
+        query_norm = query.lower()
+        target_norm = target.lower()
+        
+        # Exact match gets highest relevance
+        if query_norm == target_norm:
+            return 1.0
+
+        # Adjust relevance based on whether the query is a substring of the
+        # target; these branches never needed the similarity score
+        if query_norm in target_norm:
+            # Prefix match (starts with) gets higher relevance
+            if target_norm.startswith(query_norm):
+                return 0.9
+            # Word boundary match gets medium-high relevance
+            elif f" {query_norm}" in target_norm or target_norm.endswith(query_norm):
+                return 0.8
+            # Substring match gets medium relevance
+            else:
+                return 0.7
+
+        # Partial match based on similarity
+        return _floored_similarity(query_norm, target_norm)
+    
+    def _calculate_text_relevance(self, query: str, line: str) -> float:
+        """Calculate relevance score for a text search match."""
+        # Normalize strings
+        query_norm = query.lower()
+        line_norm = line.lower()
+        
+        # Calculate string similarity
+        similarity = _similarity(query_norm, line_norm)
+        
+        # Count occurrences of the query in the line
+        occurrences = line_norm.count(query_norm)
+        
+        # Adjust relevance based on occurrences and similarity
+        if occurrences > 1:
+            return min(1.0, 0.6 + (occurrences * 0.1) + (similarity * 0.3))
+        else:
+            return min(1.0, 0.5 + (similarity * 0.5))
+    
+    def _locate_symbol(self, file_path: str, search_text: str) -> tuple:
+        """Memoized _find_in_file, invalidated when the index changes."""
+        if self._symbol_locations_version != self.indexer.version:
+            self._symbol_location_cache.clear()
+            self._symbol_locations_version = self.indexer.version
+
+        key = (file_path, search_text)
+        hit = self._symbol_location_cache.get(key)
+        if hit is None:
+            hit = self._find_in_file(file_path, search_text)
+            self._symbol_location_cache[key] = hit
+        return hit
+
+    @staticmethod
+    def _mmap_find_line(file_path: str, needle: str, require: bytes = None):
+        """Locate a needle on disk via mmap without loading the file.
+
+        Returns (line_number, line_text) for the first line containing the
+        needle (and `require`, when given), (0, "") when absent, or None when
+        the file can't be mapped so the caller can fall back.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    needle_bytes = needle.encode('utf-8')
+                    offset = mm.find(needle_bytes)
+                    while offset >= 0:
+                        start = mm.rfind(b'\n', 0, offset) + 1
+                        end = mm.find(b'\n', offset)
+                        if end == -1:
+                            end = len(mm)
+                        line = mm[start:end]
+                        if require is None or require in line:
+                            # mmap has no count(); one prefix slice does it
+                            line_no = mm[:offset].count(b'\n') + 1
+                            return line_no, line.decode('utf-8', 'replace').strip()
+                        offset = mm.find(needle_bytes, end + 1)
+                    return 0, ""
+        except (OSError, ValueError):
+            return None
+
+    def _find_in_file(self, file_path: str, search_text: str) -> tuple:
+        """Find a specific text in a file and return line number and text."""
+        # For files not already cached in memory, let mmap + C-level find do
+        # the scan instead of pulling the whole file into the caches
+        if file_path not in self.indexer.file_contents:
+            hit = self._mmap_find_line(file_path, search_text)
+            if hit is not None:
+                line_no, line_text = hit
+                return (line_no, line_text) if line_no else (1, "")
+
+        # Cached line split — this used to re-splitlines the file per lookup
+        _, lines, _ = self._get_lc(file_path)
+
+        for i, line in enumerate(lines, 1):
+            if search_text in line:
+                return i, line.strip()
+
+        return 1, ""  # Default to first line if not found
+
+    def _find_include_in_file(self, file_path: str, include_name: str) -> tuple:
+        """Find a specific include directive in a file."""
+        if file_path not in self.indexer.file_contents:
+            hit = self._mmap_find_line(file_path, include_name, require=b"#include")
+            if hit is not None:
+                return hit
+
+        _, lines, _ = self._get_lc(file_path)
+
+        for i, line in enumerate(lines, 1):
+            if "#include" in line and include_name in line:
+                return i, line.strip()
+
+        return 0, ""  # Not found
+    
+    def find_related_components(self, file_path: str) -> List[Dict[str, Any]]:
+        """Find components related to the given file."""
+        if not file_path or file_path not in self.indexer.files:
+            return []
+            
+        # One insertion-ordered dict keyed by file replaces the list build +
+        # trailing dedup pass; setdefault keeps the first relationship seen,
+        # matching the old first-wins semantics
+        related: Dict[str, Dict[str, Any]] = {}
+
+        # Find dependencies
+        for dep in self.indexer.dependencies.get(file_path, ()):
+            related.setdefault(dep, {
+                'file': dep,
+                'relationship': 'dependency'
+            })
+
+        # Find dependents (files that include this file) via the reverse map
+        for dep_file in self.indexer.reverse_dependencies().get(file_path, ()):
+            related.setdefault(dep_file, {
+                'file': dep_file,
+                'relationship': 'dependent'
+            })
+
+        # Find files with similar components
+        file_id = self.indexer.path_id(file_path)
+        for comp, files in self.indexer.components.items():
+            if file_id not in files:
+                continue
+            for comp_file in self.indexer.paths_for(files):
+                if comp_file != file_path:
+                    related.setdefault(comp_file, {
+                        'file': comp_file,
+                        'relationship': f'shares component: {comp}'
+                    })
+
+        # Find files with similar classes
+        for cls, files in self.indexer.classes.items():
+            if file_id not in files:
+                continue
+            for cls_file in self.indexer.paths_for(files):
+                if cls_file != file_path:
+                    related.setdefault(cls_file, {
+                        'file': cls_file,
+                        'relationship': f'shares class: {cls}'
+                    })
+
+        return list(related.values())
+    
+    def find_usage_examples(self, file_path: str, max_examples: int = 5) -> List[Dict[str, Any]]:
+        """Find usage examples for components defined in the given file."""
+        if not file_path or file_path not in self.indexer.files:
+            return []
+            
+        file_id = self.indexer.path_id(file_path)
+
+        # Gather candidate (kind, name, file) tuples before touching any
+        # content; duplicates (the same name found via several kinds or the
+        # same file repeated) are filtered here rather than re-extracted
+        candidates = []
+        seen_pairs = set()
+        for kind, mapping in (('component', self.indexer.components),
+                              ('class', self.indexer.classes)):
+            for name, files in mapping.items():
+                if file_id not in files:
+                    continue
+                for other_file in self.indexer.paths_for(files):
+                    if other_file == file_path:
+                        continue
+                    pair = (other_file, name)
+                    if pair not in seen_pairs:
+                        seen_pairs.add(pair)
+                        candidates.append((kind, name, other_file))
+
+        # Snippet extraction (the part that reads file content) stops the
+        # moment enough examples are collected
+        examples = []
+        for kind, name, other_file in candidates:
+            snippet = self._extract_code_snippet(other_file, name)
+            if snippet:
+                examples.append({
+                    'file': other_file,
+                    'code': snippet,
+                    'type': kind,
+                    'name': name
+                })
+                if len(examples) >= max_examples:
+                    break
+
+        return examples
+    
+    def _get_line_starts(self, file_path: str, content: str) -> List[int]:
+        """Cached offsets of every line start in a file's content."""
+        version = self.indexer.version
+        entry = self._line_starts_cache.get(file_path)
+        if entry is not None and self._file_entry_current(file_path, entry[0]):
+            self._line_starts_cache.move_to_end(file_path)
+            return entry[1]
+
+        starts = [0]
+        find = content.find
+        i = find('\n')
+        while i != -1:
+            starts.append(i + 1)
+            i = find('\n', i + 1)
+
+        self._line_starts_cache[file_path] = (version, starts)
+        if len(self._line_starts_cache) > _LC_CACHE_MAX_ENTRIES:
+            self._line_starts_cache.popitem(last=False)
+        return starts
+
+    def _extract_code_snippet(self, file_path: str, search_text: str, context_lines: int = 5) -> str:
+        """Extract a code snippet around a search text with context lines."""
+        content = self.indexer.get_file_content(file_path)
+
+        # One C-level find plus offset arithmetic; no per-call splitlines
+        offset = content.find(search_text)
+        if offset < 0:
+            return ""
+
+        starts = self._get_line_starts(file_path, content)
+        line_index = bisect.bisect_right(starts, offset) - 1
+        start_line = max(0, line_index - context_lines)
+        end_line = line_index + context_lines + 1
+
+        begin = starts[start_line]
+        end = starts[end_line] if end_line < len(starts) else len(content)
+        snippet = content[begin:end]
+        return snippet[:-1] if snippet.endswith('\n') else snippet